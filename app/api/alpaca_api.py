@@ -30,6 +30,9 @@ class AlpacaAPI:
             self.client = REST(api_key, api_secret, "https://api.alpaca.markets")
             self.logger.info("AlpacaAPI initialized.")
 
+        # SymbolInfo of every tradable asset, filled by get_trading_symbols from the same asset list
+        self._symbol_infos = {}
+
     def get_trading_symbols(self):
         """
         Fetches all available tradable assets filtered by asset type.
@@ -48,6 +51,10 @@ class AlpacaAPI:
 
             # Extract symbols
             symbols = [asset.symbol for asset in filtered_assets]
+            self._symbol_infos = {asset.symbol: SymbolInfo(name=asset._raw.get("name") or asset.symbol,
+                                                           exchange=asset._raw.get("exchange") or "Alpaca",
+                                                           symbol=asset.symbol)
+                                  for asset in filtered_assets}
 
             self.logger.debug(f"Fetched tradable symbols for {self.assets_type}: {symbols}")
             return symbols
@@ -237,6 +244,8 @@ class AlpacaAPI:
         :param symbol: The asset symbol (e.g., 'AAPL').
         :return: SymbolInfo object containing name, exchange, and symbol.
         """
+        if symbol in self._symbol_infos:
+            return self._symbol_infos[symbol]  # Listed by get_trading_symbols, no request needed
         try:
             asset = self.client.get_asset(symbol)
             name = asset.name if hasattr(asset, "name") else symbol
@@ -1,4 +1,5 @@
 import os
+import time
 from app.utils.logger import setup_logger
 from app.api.binance_api import BinanceAPI
 from app.api.alpaca_api import AlpacaAPI
@@ -15,6 +16,15 @@ class APIManager:
         self.logger = logger if logger else setup_logger()
         self.config = ConfigLoader("app/utils/config/config.json")
         self.enable_test_trading = self.config.get("enable_test_trading", False)
+
+        # Symbol metadata does not change during a session, so it is kept until the app exits;
+        # ticker info is reused for a short while so the fetches of a tab or interval switch share
+        # the last request. Scheduled ticker polls bypass the cache (use_cache=False) and refill it,
+        # so the TTL only has to cover bursts and is kept below the poll interval.
+        # Both are keyed by (api name, symbol), so switching APIs never serves another API's data.
+        self._symbol_info_cache = {}
+        self._ticker_cache = {}  # (api name, symbol) -> (expiry, ticker info)
+        self._ticker_ttl = self.config.get("ticker_cache_ttl_ms", 500) / 1000
         
         # Initialize APIs
         self.api_clients = {
@@ -84,22 +94,27 @@ class APIManager:
         else:
             return self.api_client.get_trading_symbols()
 
-    def get_candlestick_data(self, trading_pair, interval='1h', limit=100, api_name=None):
+    def get_candlestick_data(self, trading_pair, interval='1h', limit=100, api_name=None, start_time=None):
         """
         Fetches candlestick data for a given trading pair.
 
         :param trading_pair: The trading pair (e.g., BTCUSDT).
         :param interval: Candlestick interval (default: '1h').
         :param limit: Number of candlesticks to fetch (default: 100).
+        :param start_time: Time of the first candle to fetch, only for APIs where supports_start_time() is True.
         :return: List of candlestick data.
         """
-        if(api_name):
-            if api_name not in self.api_clients:
-                raise ValueError(f"Unsupported API: {api_name}")
-            else:
-                return self.api_clients[api_name].get_candlestick_data(trading_pair, interval, limit)
-        else:
-            return self.api_client.get_candlestick_data(trading_pair, interval, limit)
+        client, _ = self._resolve_client(api_name)
+        if start_time is None:
+            return client.get_candlestick_data(trading_pair, interval, limit)
+        return client.get_candlestick_data(trading_pair, interval, limit, start_time=start_time)
+
+    def supports_start_time(self, api_name=None):
+        """
+        Tells whether get_candlestick_data accepts start_time for the given API (default: the current one).
+        """
+        client, _ = self._resolve_client(api_name)
+        return getattr(client, "supports_start_time", False)
 
     def get_depth_data(self, trading_pair, limit=100):
         """
@@ -111,20 +126,25 @@ class APIManager:
         """
         return self.api_client.get_depth_data(trading_pair, limit)
 
-    def get_ticker_info(self, trading_pair, api_name=None):
+    def get_ticker_info(self, trading_pair, api_name=None, use_cache=True):
         """
         Fetches ticker information for the given trading pair.
 
         :param trading_pair: The trading pair (e.g., BTCUSDT).
+        :param use_cache: Whether a ticker fetched less than ticker_cache_ttl_ms ago may be returned;
+                          with False the API is always called and the cache refreshed.
         :return: A dictionary containing price, change, high, low, and volume.
         """
-        if(api_name):
-            if api_name not in self.api_clients:
-                raise ValueError(f"Unsupported API: {api_name}")
-            else:
-                return self.api_clients[api_name].get_ticker_info(trading_pair)
-        else:
-            return self.api_client.get_ticker_info(trading_pair)
+        client, api_name = self._resolve_client(api_name)
+        key = (api_name, trading_pair)
+        cached = self._ticker_cache.get(key)
+        now = time.monotonic()
+        if use_cache and cached and cached[0] > now:
+            return cached[1]
+
+        ticker = client.get_ticker_info(trading_pair)
+        self._ticker_cache[key] = (now + self._ticker_ttl, ticker)
+        return ticker
 
     def get_open_orders(self, pair):
         """
@@ -161,13 +181,26 @@ class APIManager:
         :param symbol: The asset symbol.
         :return: SymbolInfo object containing name, exchange, and symbol.
         """
+        client, api_name = self._resolve_client(api_name)
+        key = (api_name, symbol)
+        if key not in self._symbol_info_cache:
+            symbol_info = client.get_symbol_info(symbol)
+            if symbol_info is None:
+                return None  # Not cached, the symbol may be listed later
+            self._symbol_info_cache[key] = symbol_info
+        return self._symbol_info_cache[key]
+
+    def _resolve_client(self, api_name=None):
+        """
+        Returns the client for api_name, or the active one when it is None.
+
+        :return: (client, api name) tuple.
+        """
         if(api_name):
             if api_name not in self.api_clients:
                 raise ValueError(f"Unsupported API: {api_name}")
-            else:
-                return self.api_clients[api_name].get_symbol_info(symbol)
-        else:
-            return self.api_client.get_symbol_info(symbol)
+            return self.api_clients[api_name], api_name
+        return self.api_client, self.api_name
     
 
 
@@ -1,10 +1,18 @@
 from binance.spot import Spot
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from app.utils.logger import setup_logger
 from app.utils.symbol_info import SymbolInfo
 
 #For example code go to: https://github.com/binance/binance-connector-python/blob/master/examples
 
+# (connect, read) timeout in seconds for every REST call, so a stalled request can't block the data worker forever
+_REQUEST_TIMEOUT = (3, 10)
+
 class BinanceAPI:
+    # get_candlestick_data accepts start_time, so callers can fetch only the newest candles
+    supports_start_time = True
+
     def __init__(self, api_key=None, api_secret=None, logger=None, test_enabled=False):
         """
         Initialize the Binance API wrapper.
@@ -19,12 +27,23 @@ class BinanceAPI:
             self.logger = logger
         
         if test_enabled:
-            self.client = Spot(api_key=api_key, api_secret=api_secret, base_url="https://testnet.binance.vision")
+            self.client = Spot(api_key=api_key, api_secret=api_secret, base_url="https://testnet.binance.vision",
+                               timeout=_REQUEST_TIMEOUT)
             self.logger.info("BinanceAPI initialized (TestNET).")
         else:
-            self.client = Spot(api_key=api_key, api_secret=api_secret)
+            self.client = Spot(api_key=api_key, api_secret=api_secret, timeout=_REQUEST_TIMEOUT)
             self.logger.info("BinanceAPI initialized.")
 
+        # The client keeps one requests.Session, so connections are reused between calls.
+        # Size its pool for the concurrent data requests and retry idempotent calls on
+        # transient gateway errors (rate limit responses are not retried)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)))
+        self.client.session.mount("https://", adapter)
+
+        # SymbolInfo of every pair, filled by get_trading_symbols from the same exchange info
+        self._symbol_infos = {}
+
     def get_trading_symbols(self):
         """
         Fetches all available trading pairs (symbols) from Binance.
@@ -33,22 +52,28 @@ class BinanceAPI:
         try:
             exchange_info = self.client.exchange_info()
             symbols = [symbol['symbol'] for symbol in exchange_info['symbols']]
+            # Binance doesn't provide asset names in exchange_info
+            self._symbol_infos = {symbol: SymbolInfo(name=symbol, exchange="Binance", symbol=symbol) for symbol in symbols}
             self.logger.debug(f"Fetched trading pairs: {symbols}")
             return symbols
         except Exception as e:
             self.logger.error(f"Error fetching trading pairs: {e}")
             raise
 
-    def get_candlestick_data(self, trading_pair, interval='1h', limit=100):
+    def get_candlestick_data(self, trading_pair, interval='1h', limit=100, start_time=None):
         """
         Fetches candlestick data for a given trading pair.
         :param trading_pair: The trading pair (e.g., BTCUSDT).
         :param interval: Candlestick interval (default: '1h').
         :param limit: Number of candlesticks to fetch (default: 100).
+        :param start_time: Open time in ms of the first candle to fetch (optional, default: the latest candles).
         :return: List of candlestick data as dictionaries.
         """
         try:
-            candlesticks = self.client.klines(trading_pair, interval, limit=limit)
+            if start_time is None:
+                candlesticks = self.client.klines(trading_pair, interval, limit=limit)
+            else:
+                candlesticks = self.client.klines(trading_pair, interval, limit=limit, startTime=start_time)
             formatted_candles = [
                 {
                     "time": candle[0],  # Timestamp
@@ -90,14 +115,12 @@ class BinanceAPI:
         :return: A dictionary containing price, change, high, low, and volume.
         """
         try:
-            # Fetch current price
-            price = self.client.ticker_price(trading_pair)
-            # Fetch 24-hour statistics
+            # Fetch 24-hour statistics; they include the last price, so one request covers both
             stats = self.client.ticker_24hr(trading_pair)
             
             # Prepare the result dictionary
             ticker_info = {
-                'price': float(price['price']),
+                'price': float(stats['lastPrice']),
                 #'change': float(stats['priceChangePercent']),
                 'high': float(stats['highPrice']),
                 'low': float(stats['lowPrice']),
@@ -184,6 +207,8 @@ class BinanceAPI:
         :param symbol: The trading pair (e.g., 'BTCUSDT').
         :return: SymbolInfo object containing name, exchange, and symbol.
         """
+        if symbol in self._symbol_infos:
+            return self._symbol_infos[symbol]  # Listed by get_trading_symbols, no request needed
         try:
             exchange_info = self.client.exchange_info()
             for s in exchange_info['symbols']:
@@ -137,7 +137,7 @@ class ThreeScreenStrategy(Strategy_class):
   
     def analyze_long_term(self, data):
         calculator = IndicatorCalculator()
-        closing_prices = calculator.extract_closing_prices(data)
+        closing_prices = calculator.extract_closing_array(data)
 
         # Get MACD values
         macd_line, signal_line, _ = calculator.calculate_macd(closing_prices, 12, 26, 9)
@@ -156,7 +156,7 @@ class ThreeScreenStrategy(Strategy_class):
 
     def analyze_mid_term(self, data):
         calculator = IndicatorCalculator()
-        closing_prices = calculator.extract_closing_prices(data)
+        closing_prices = calculator.extract_closing_array(data)
 
         rsi = calculator.calculate_rsi(14, closing_prices)
         std_dev_multiplier = 2
@@ -170,7 +170,7 @@ class ThreeScreenStrategy(Strategy_class):
 
     def analyze_short_term(self, data):
         calculator = IndicatorCalculator()
-        closing_prices = calculator.extract_closing_prices(data)
+        closing_prices = calculator.extract_closing_array(data)
         ema_9 = calculator.calculate_ema(9, closing_prices)
         ema_21 = calculator.calculate_ema(21, closing_prices)
         if ema_9[-1] > ema_21[-1]:
@@ -77,4 +77,79 @@ def test_account_balances(api_manager, api_name):
     api_manager.set_api(api_name)
     balances = api_manager.get_account_balances()
 
-    assert isinstance(balances, dict)
\ No newline at end of file
+    assert isinstance(balances, dict)
+
+
+class _CountingClient:
+    """Stand-in API client that counts the calls reaching it."""
+
+    def __init__(self):
+        self.calls = {"ticker": 0, "symbol": 0}
+
+    def get_ticker_info(self, trading_pair):
+        self.calls["ticker"] += 1
+        return {"price": float(self.calls["ticker"])}
+
+    def get_symbol_info(self, symbol):
+        self.calls["symbol"] += 1
+        return None if symbol == "UNKNOWN" else symbol
+
+
+@pytest.fixture
+def counting_manager(api_manager):
+    """APIManager whose binance client is replaced by a call counter."""
+    client = _CountingClient()
+    api_manager.api_clients["binance"] = client
+    api_manager.set_api("binance")
+    return api_manager, client
+
+
+def test_symbol_info_is_cached(counting_manager):
+    """Symbol info is fetched once per symbol; unknown symbols are not cached."""
+    manager, client = counting_manager
+    assert manager.get_symbol_info("BTCUSDT") == manager.get_symbol_info("BTCUSDT")
+    assert client.calls["symbol"] == 1
+    assert manager.get_symbol_info("UNKNOWN") is None
+    assert manager.get_symbol_info("UNKNOWN") is None
+    assert client.calls["symbol"] == 3
+
+
+def test_ticker_info_expires(counting_manager):
+    """Ticker info is reused until its TTL runs out."""
+    manager, client = counting_manager
+    manager._ticker_ttl = 60
+    assert manager.get_ticker_info("BTCUSDT") == manager.get_ticker_info("BTCUSDT")
+    assert client.calls["ticker"] == 1
+
+    manager._ticker_ttl = 0
+    manager._ticker_cache.clear()
+    manager.get_ticker_info("BTCUSDT")
+    assert manager.get_ticker_info("BTCUSDT")["price"] == 3
+
+
+def test_ticker_info_bypasses_cache(counting_manager):
+    """use_cache=False always reaches the client and refreshes the cached ticker."""
+    manager, client = counting_manager
+    manager._ticker_ttl = 60
+    manager.get_ticker_info("BTCUSDT")
+    assert manager.get_ticker_info("BTCUSDT", use_cache=False)["price"] == 2
+    assert client.calls["ticker"] == 2
+    assert manager.get_ticker_info("BTCUSDT")["price"] == 2
+
+
+def test_scheduled_pair_info_poll_reaches_client(counting_manager):
+    """Every scheduled pair info poll of the data worker fetches a fresh ticker."""
+    from app.ui.windows import DataUpdateWorker
+
+    manager, client = counting_manager
+    manager._ticker_ttl = 60
+    worker = DataUpdateWorker(manager)
+    tickers = []
+    worker.pair_info_fetched.connect(lambda request_id, symbol_info, ticker: tickers.append(ticker["price"]))
+    try:
+        worker.fetch_pair_info(1, "BTCUSDT")
+        worker.fetch_pair_info(1, "BTCUSDT")
+    finally:
+        worker._executor.shutdown()
+    assert tickers == [1.0, 2.0]
+    assert client.calls["ticker"] == 2
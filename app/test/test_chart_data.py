@@ -0,0 +1,116 @@
+import pytest
+import numpy as np
+from app.ui.charts import prepare_chart_data, prepare_depth_data, candles_to_soa
+
+
+def make_candles(closes, start=0):
+    """Helper to build candlestick dicts with consecutive timestamps"""
+    return [{"time": (start + i) * 60_000, "open": c, "high": c + 1, "low": c - 1, "close": c, "volume": 1.0}
+            for i, c in enumerate(closes)]
+
+
+def assert_same_indicators(result, expected):
+    """Helper to compare every indicator series of two prepare_chart_data results"""
+    for name in ("sma", "ema", "rsi"):
+        np.testing.assert_allclose(result[name], expected[name], equal_nan=True)
+    for result_band, expected_band in zip(result["bb"], expected["bb"]):
+        np.testing.assert_allclose(result_band, expected_band, equal_nan=True)
+
+
+class TestCandlesToSoa:
+    """Tests for the list-of-dicts to SoA candle conversion"""
+
+    def test_one_contiguous_array_per_field(self):
+        """Each field becomes its own contiguous array with the expected dtype"""
+        candles = candles_to_soa(make_candles([100.0, 101.0, 102.0]))
+
+        assert candles["time"].dtype == np.int64
+        np.testing.assert_array_equal(candles["close"], [100.0, 101.0, 102.0])
+        np.testing.assert_array_equal(candles["high"], [101.0, 102.0, 103.0])
+        assert all(values.flags["C_CONTIGUOUS"] for values in candles.values())
+
+    def test_empty_list(self):
+        """An empty list gives empty arrays"""
+        candles = candles_to_soa([])
+        assert all(len(values) == 0 for values in candles.values())
+
+
+class TestPrepareChartData:
+    """Tests for the indicator data prepared for the TradingView charts"""
+
+    closes = list(np.random.default_rng(3).uniform(90, 110, 60))
+    period = 14
+
+    def test_disabled_indicators_are_none(self):
+        """Only the RSI is computed when no overlay is enabled"""
+        data = prepare_chart_data(make_candles(self.closes), self.period)
+        assert data["sma"] is None and data["ema"] is None and data["bb"] is None
+        assert len(data["rsi"]) == len(self.closes) - self.period
+
+    def test_rsi_can_be_disabled(self):
+        """The RSI is skipped when it is not enabled"""
+        data = prepare_chart_data(make_candles(self.closes), self.period, True, False, False, rsi_enabled=False)
+        assert data["rsi"] is None
+        assert data["sma"] is not None
+
+    def test_live_candle_update_matches_full_recompute(self):
+        """Updating only the last candle gives the same series as recomputing everything"""
+        first = prepare_chart_data(make_candles(self.closes), self.period, True, True, True)
+
+        updated = self.closes[:-1] + [self.closes[-1] + 5]
+        incremental = prepare_chart_data(make_candles(updated), self.period, True, True, True, state=first["state"])
+        full = prepare_chart_data(make_candles(updated), self.period, True, True, True)
+
+        assert_same_indicators(incremental, full)
+
+    def test_new_candle_moves_window_averages(self):
+        """When the window moves by one candle, every indicator matches a full recompute"""
+        first = prepare_chart_data(make_candles(self.closes), self.period, True, True, True)
+
+        moved = self.closes[1:] + [100.0]
+        incremental = prepare_chart_data(make_candles(moved, start=1), self.period, True, True, True, state=first["state"])
+        full = prepare_chart_data(make_candles(moved, start=1), self.period, True, True, True)
+
+        assert_same_indicators(incremental, full)
+
+    def test_consecutive_moves_match_full_recompute(self):
+        """Several closes in a row, each followed by a live update, don't drift from a full recompute"""
+        closes = list(self.closes)
+        data = prepare_chart_data(make_candles(closes), self.period, True, True, True)
+        for start in range(1, 6):
+            closes = closes[1:] + [closes[-1] + start]
+            data = prepare_chart_data(make_candles(closes, start=start), self.period, True, True, True, state=data["state"])
+            closes[-1] += 0.5
+            data = prepare_chart_data(make_candles(closes, start=start), self.period, True, True, True, state=data["state"])
+
+        full = prepare_chart_data(make_candles(closes, start=5), self.period, True, True, True)
+        assert_same_indicators(data, full)
+
+    def test_enabling_an_indicator_reuses_computed_series(self):
+        """Toggling an overlay on the same candles keeps the series already computed"""
+        candles = candles_to_soa(make_candles(self.closes))
+        first = prepare_chart_data(candles, self.period, True, False, False)
+        toggled = prepare_chart_data(candles, self.period, True, True, False, state=first["state"])
+        full = prepare_chart_data(candles, self.period, True, True, False)
+
+        assert toggled["state"]["series"]["sma"] is first["state"]["series"]["sma"]
+        np.testing.assert_allclose(toggled["ema"], full["ema"], equal_nan=True)
+
+
+class TestPrepareDepthData:
+    """Tests for the cumulative order book drawn by the depth chart"""
+
+    def test_sorted_from_best_price_with_running_volumes(self):
+        """Bids descend and asks ascend from the best price, with cumulative volumes"""
+        depth = prepare_depth_data({"bids": [["99.0", "1.0"], ["100.0", "2.0"], ["98.0", "0.5"]],
+                                    "asks": [["102.0", "1.0"], ["101.0", "3.0"]]})
+
+        np.testing.assert_array_equal(depth["bid_prices"], [100.0, 99.0, 98.0])
+        np.testing.assert_array_equal(depth["bid_volumes"], [2.0, 3.0, 3.5])
+        np.testing.assert_array_equal(depth["ask_prices"], [101.0, 102.0])
+        np.testing.assert_array_equal(depth["ask_volumes"], [3.0, 4.0])
+
+    def test_empty_book(self):
+        """An empty side gives empty arrays"""
+        depth = prepare_depth_data({"bids": [], "asks": []})
+        assert all(len(values) == 0 for values in depth.values())
@@ -321,3 +321,24 @@ class TestConfigLoaderWithRealConfigStructure:
 
         finally:
             os.unlink(temp_path)
+
+
+class TestConfigLoaderCache:
+    """Tests for the parsed config shared between loaders"""
+
+    def test_same_file_is_parsed_once(self, valid_config_file):
+        """Loaders of an unchanged file should share the parsed config"""
+        config1 = ConfigLoader(valid_config_file)
+        config2 = ConfigLoader(valid_config_file)
+
+        assert config1.config is config2.config
+
+    def test_modified_file_is_reloaded(self, valid_config_file):
+        """A loader created after the file changes should see the new values"""
+        ConfigLoader(valid_config_file)
+
+        with open(valid_config_file, 'w') as f:
+            json.dump({"num_candles": 250}, f)
+        os.utime(valid_config_file, ns=(0, 1))  # Force a different modification time
+
+        assert ConfigLoader(valid_config_file).get("num_candles") == 250
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from app.utils.indicators import IndicatorCalculator
 
 
@@ -25,6 +26,22 @@ class TestExtractClosingPrices:
         result = IndicatorCalculator.extract_closing_prices(candlesticks)
         assert result == [100.5, 102.3, 99.8]
 
+    def test_extract_closing_array(self):
+        """Should return the same prices as a float64 array that the indicators accept"""
+        candlesticks = [{"close": "100.5"}, {"close": 102}, {"close": 99.8}]
+        result = IndicatorCalculator.extract_closing_array(candlesticks)
+        assert result.dtype == np.float64
+        assert result.tolist() == IndicatorCalculator.extract_closing_prices(candlesticks)
+        assert IndicatorCalculator.calculate_sma(2, result) == IndicatorCalculator.calculate_sma(2, result.tolist())
+
+    def test_extract_closing_array_from_columns(self):
+        """Candles stored by column should return their close column without a copy"""
+        closes = np.array([100.5, 102.0, 99.8])
+        assert IndicatorCalculator.extract_closing_array({"time": np.arange(3), "close": closes}) is closes
+
+        structured = np.array([(1, 100.5), (2, 102.0)], dtype=[("time", "i8"), ("close", "f8")])
+        assert IndicatorCalculator.extract_closing_array(structured).tolist() == [100.5, 102.0]
+
 
 class TestCalculateSMA:
     """Tests for Simple Moving Average (SMA)"""
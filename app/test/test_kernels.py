@@ -0,0 +1,170 @@
+import pytest
+import numpy as np
+from app.utils import kernels
+
+
+def to_array(values):
+    """Helper to convert indicator lists with None padding into float arrays"""
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+class TestRSIKernel:
+    """Tests for the Wilder-smoothed RSI kernel"""
+
+    def test_rsi_matches_reference_wilder_rsi(self):
+        """Kernel should match a plain Python Wilder RSI"""
+        closing_prices = [100, 102, 98, 101, 99, 103, 97, 102, 100, 101] * 5
+        period = 14
+
+        # Reference: simple mean of the first `period` changes, then Wilder's smoothing
+        changes = [b - a for a, b in zip(closing_prices, closing_prices[1:])]
+        avg_gain = sum(max(c, 0) for c in changes[:period]) / period
+        avg_loss = sum(max(-c, 0) for c in changes[:period]) / period
+        expected = [None] * period
+        for i in range(period, len(closing_prices)):
+            if i > period:
+                change = changes[i - 1]
+                avg_gain = (avg_gain * (period - 1) + max(change, 0)) / period
+                avg_loss = (avg_loss * (period - 1) + max(-change, 0)) / period
+            expected.append(100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss))
+
+        result = kernels.rsi(np.asarray(closing_prices, dtype=np.float64), period)
+
+        np.testing.assert_allclose(result, to_array(expected), equal_nan=True)
+
+    def test_rsi_padding(self):
+        """First 'period' values should be NaN"""
+        closing_prices = np.arange(100, 130, dtype=np.float64)
+        period = 14
+        result = kernels.rsi(closing_prices, period)
+
+        assert len(result) == len(closing_prices)
+        assert np.isnan(result[:period]).all()
+        assert not np.isnan(result[period:]).any()
+
+    def test_rsi_all_gains(self):
+        """RSI should be 100 when all movements are gains"""
+        result = kernels.rsi(np.arange(100, 120, dtype=np.float64), 14)
+        assert result[-1] == 100
+
+    def test_rsi_insufficient_data(self):
+        """Should return only NaN values when there is not enough data"""
+        result = kernels.rsi(np.array([100.0, 101.0, 102.0]), 14)
+        assert np.isnan(result).all()
+
+
+class TestParallelCumsumKernel:
+    """Tests for the block-parallel cumulative sum kernel"""
+
+    def test_matches_numpy_cumsum_across_blocks(self):
+        """Block scan should give the same running totals as np.cumsum"""
+        values = np.random.default_rng(0).random(10_000)
+        result = kernels.parallel_cumsum(values, 1024)
+        np.testing.assert_allclose(result, np.cumsum(values))
+
+    def test_short_input_single_block(self):
+        """Inputs shorter than one block are scanned in a single pass"""
+        result = kernels.parallel_cumsum(to_array([1, 2, 3, 4]))
+        np.testing.assert_array_equal(result, [1, 3, 6, 10])
+
+    def test_empty_input(self):
+        """An empty input returns an empty array"""
+        assert len(kernels.parallel_cumsum(to_array([]))) == 0
+
+
+class TestMovingAverageKernels:
+    """Tests for the SMA and EMA kernels"""
+
+    def test_sma_matches_rolling_mean(self):
+        """Each SMA value is the mean of the window ending at that index"""
+        closing_prices = np.random.default_rng(1).uniform(90, 110, 60)
+        period = 14
+        result = kernels.sma(closing_prices, period)
+
+        expected = np.convolve(closing_prices, np.ones(period) / period, mode='valid')
+        assert np.isnan(result[:period - 1]).all()
+        np.testing.assert_allclose(result[period - 1:], expected)
+
+    def test_ema_matches_reference_ema(self):
+        """Kernel should match a plain Python EMA seeded with the SMA of the first window"""
+        closing_prices = [100, 102, 98, 101, 99, 103, 97, 102, 100, 101] * 5
+        period = 10
+
+        multiplier = 2 / (period + 1)
+        ema = sum(closing_prices[:period]) / period
+        expected = [None] * (period - 1) + [ema]
+        for price in closing_prices[period:]:
+            ema = (price - ema) * multiplier + ema
+            expected.append(ema)
+
+        expected = to_array(expected)
+        result = kernels.ema(np.asarray(closing_prices, dtype=np.float64), period)
+
+        np.testing.assert_allclose(result, expected, equal_nan=True)
+
+    def test_insufficient_data(self):
+        """Should return only NaN values when there is not enough data"""
+        closing_prices = np.array([100.0, 101.0, 102.0])
+        assert np.isnan(kernels.sma(closing_prices, 14)).all()
+        assert np.isnan(kernels.ema(closing_prices, 14)).all()
+
+
+class TestBollingerBandsKernel:
+    """Tests for the sliding-window Bollinger Bands kernel"""
+
+    def test_matches_rolling_std(self):
+        """Bands should be mean ± k * population std of each window"""
+        closing_prices = np.random.default_rng(2).uniform(90, 110, 80)
+        period = 20
+        upper, lower = kernels.bollinger_bands(closing_prices, period, 2.0)
+
+        windows = np.lib.stride_tricks.sliding_window_view(closing_prices, period)
+        mean = windows.mean(axis=1)
+        std = windows.std(axis=1)
+        assert np.isnan(upper[:period - 1]).all()
+        np.testing.assert_allclose(upper[period - 1:], mean + 2 * std)
+        np.testing.assert_allclose(lower[period - 1:], mean - 2 * std)
+
+    def test_rolling_mean_std_matches_windows(self):
+        """Rolling mean and std should match the population statistics of each window"""
+        closing_prices = np.random.default_rng(4).uniform(90, 110, 80)
+        period = 20
+        means, std_devs = kernels.rolling_mean_std(closing_prices, period)
+
+        windows = np.lib.stride_tricks.sliding_window_view(closing_prices, period)
+        assert np.isnan(means[:period - 1]).all() and np.isnan(std_devs[:period - 1]).all()
+        np.testing.assert_allclose(means[period - 1:], windows.mean(axis=1))
+        np.testing.assert_allclose(std_devs[period - 1:], windows.std(axis=1))
+
+    def test_zero_volatility(self):
+        """Flat prices should collapse both bands onto the price"""
+        upper, lower = kernels.bollinger_bands(np.full(40, 100.0), 20, 2.0)
+        assert upper[-1] == lower[-1] == 100
+
+
+class TestMACDKernel:
+    """Tests for the single-pass MACD kernel"""
+
+    def test_matches_separate_emas(self):
+        """MACD should be the EMA difference and the signal an EMA of the defined MACD values"""
+        closing_prices = np.random.default_rng(3).uniform(90, 110, 80)
+        macd_line, signal_line, histogram = kernels.macd(closing_prices, 12, 26, 9)
+
+        expected_macd = kernels.ema(closing_prices, 12) - kernels.ema(closing_prices, 26)
+        expected_signal = np.full(len(closing_prices), np.nan)
+        expected_signal[25:] = kernels.ema(expected_macd[25:], 9)
+
+        np.testing.assert_allclose(macd_line, expected_macd, equal_nan=True)
+        np.testing.assert_allclose(signal_line, expected_signal, equal_nan=True)
+        np.testing.assert_allclose(histogram, expected_macd - expected_signal, equal_nan=True)
+
+    def test_padding(self):
+        """MACD starts at long_period - 1 and the signal signal_period - 1 values later"""
+        macd_line, signal_line, _ = kernels.macd(np.arange(100, 150, dtype=np.float64), 12, 26, 9)
+        assert np.isnan(macd_line[:25]).all() and not np.isnan(macd_line[25:]).any()
+        assert np.isnan(signal_line[:33]).all() and not np.isnan(signal_line[33:]).any()
+
+    def test_insufficient_data(self):
+        """Should return only NaN values when there is not enough data for the slow EMA"""
+        result = kernels.macd(np.arange(100, 120, dtype=np.float64), 12, 26, 9)
+        assert all(np.isnan(values).all() for values in result)
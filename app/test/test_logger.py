@@ -0,0 +1,73 @@
+import logging
+import threading
+from app.utils.logger import RateLimitingFilter, setup_logger
+
+
+def make_record(msg, level=logging.INFO, args=()):
+    """Helper to build a log record"""
+    return logging.LogRecord("test", level, __file__, 1, msg, args, None)
+
+
+class TestRateLimitingFilter:
+    """Tests for the filter throttling repeated log messages"""
+
+    def test_repeated_message_is_dropped_within_interval(self):
+        """The same INFO message is only let through once per interval"""
+        log_filter = RateLimitingFilter(interval=60)
+
+        assert log_filter.filter(make_record("Updated pair info for %s.", args=("BTCUSDC",)))
+        assert not log_filter.filter(make_record("Updated pair info for %s.", args=("ETHUSDC",)))
+        assert log_filter.filter(make_record("Another message"))
+
+    def test_warnings_are_never_dropped(self):
+        """Records above INFO always pass"""
+        log_filter = RateLimitingFilter(interval=60)
+
+        assert log_filter.filter(make_record("Failure", level=logging.ERROR))
+        assert log_filter.filter(make_record("Failure", level=logging.ERROR))
+
+    def test_message_passes_again_after_interval(self):
+        """A zero interval lets every record through"""
+        log_filter = RateLimitingFilter(interval=0)
+
+        assert log_filter.filter(make_record("Tick"))
+        assert log_filter.filter(make_record("Tick"))
+
+    def test_expired_messages_are_forgotten(self):
+        """Keys older than the interval are swept, so one-off messages don't accumulate"""
+        log_filter = RateLimitingFilter(interval=60)
+        for i in range(100):
+            assert log_filter.filter(make_record(f"Placed order: {i}"))
+        assert len(log_filter._last_emitted) == 100
+
+        # Age every key past the interval; the next record triggers the sweep
+        log_filter._last_emitted = {key: t - 120 for key, t in log_filter._last_emitted.items()}
+        log_filter._last_sweep -= 120
+        assert log_filter.filter(make_record("Tick"))
+        assert len(log_filter._last_emitted) == 1
+
+    def test_only_refresh_logger_is_rate_limited(self):
+        """The app logger keeps every record; only its "refresh" child is throttled"""
+        logger = setup_logger()
+
+        assert not any(isinstance(f, RateLimitingFilter) for f in logger.filters)
+        assert any(isinstance(f, RateLimitingFilter) for f in logger.getChild("refresh").filters)
+
+    def test_concurrent_records(self):
+        """Records filtered from several threads at once never fail while keys are swept"""
+        log_filter = RateLimitingFilter(interval=0.001)
+        errors = []
+
+        def log_many(thread):
+            try:
+                for i in range(2000):
+                    log_filter.filter(make_record(f"Placed order: {thread}-{i}"))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=log_many, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
@@ -0,0 +1,13 @@
+"""
+Thread pool shared by the UI tabs.
+
+Tabs submit their QRunnable tasks here instead of to QThreadPool.globalInstance(),
+so the number of worker threads stays bounded and Qt's own pool is never starved.
+Tasks must only work with Python/NumPy data and never touch Qt widgets; results
+go back to the GUI thread through a pyqtSignal.
+"""
+import os
+from PyQt5.QtCore import QThreadPool
+
+pool = QThreadPool()
+pool.setMaxThreadCount(max(2, (os.cpu_count() or 1) - 1))
@@ -1,15 +1,344 @@
-from PyQt5.QtWidgets import QVBoxLayout, QWidget, QGraphicsRectItem
+from PyQt5.QtWidgets import QVBoxLayout, QWidget, QGraphicsItem, QGraphicsView
 import pyqtgraph as pg
-from PyQt5.QtCore import Qt
-from app.utils.indicators import IndicatorCalculator
+from PyQt5.QtCore import Qt, QLineF, QRectF
+from app.utils import kernels
 import datetime
 import numpy as np
 
+# Global pyqtgraph options: Numba-accelerated path building when available, OpenGL
+# rendering and no antialiasing, which is expensive for dense candlestick plots.
+# The default dark background is kept to match the application's dark mode.
+pg.setConfigOptions(useNumba=kernels.NUMBA_AVAILABLE, useOpenGL=True, antialias=False)
+
+
+def _viewport_update_mode():
+    """
+    Viewport update mode for the chart views: an OpenGL viewport can't repaint only part
+    of itself, so it is always fully updated; a raster viewport repaints the dirty regions.
+    """
+    if pg.getConfigOption("useOpenGL"):
+        return QGraphicsView.FullViewportUpdate
+    return QGraphicsView.SmartViewportUpdate
+
+
+# Pens and brushes for the fixed chart palette, built once and shared by every chart
+_PEN_UP = pg.mkPen((0, 255, 0), width=1)
+_PEN_DOWN = pg.mkPen((255, 0, 0), width=1)
+_BRUSH_UP = pg.mkBrush((0, 255, 0))
+_BRUSH_DOWN = pg.mkBrush((255, 0, 0))
+_BRUSH_BUY_VOLUME = pg.mkBrush(0, 255, 0, 150)
+_BRUSH_SELL_VOLUME = pg.mkBrush(255, 0, 0, 150)
+_PEN_SMA = pg.mkPen('blue', width=1)
+_PEN_EMA = pg.mkPen('orange', width=1)
+_PEN_BB_UPPER = pg.mkPen('green', width=1)
+_PEN_BB_LOWER = pg.mkPen('red', width=1)
+_PEN_BIDS = pg.mkPen('g', width=2)
+_PEN_ASKS = pg.mkPen('r', width=2)
+_PEN_RSI = pg.mkPen('purple', width=2)
+_PEN_OB = pg.mkPen('red', width=1, style=Qt.DashLine)
+_PEN_OS = pg.mkPen('green', width=1, style=Qt.DashLine)
+
+# Standard deviations between the Bollinger middle line and each band
+_BB_STD_DEV = 2.0
+
+# Below this many order book levels a single np.cumsum call beats the parallel scan
+_PARALLEL_CUMSUM_MIN_LEVELS = 10_000
+
 class TimeAxisItem(pg.AxisItem):
     def tickStrings(self, values, scale, spacing):
         """Convert timestamp values into human-readable date strings."""
         return [datetime.datetime.fromtimestamp(value/1000).strftime("%Y-%m-%d %H:%M") for value in values]
-    
+
+
+# Fields of a candle, in the order the API returns them
+CANDLE_FIELDS = ("time", "open", "high", "low", "close", "volume")
+
+
+def candles_to_soa(candlestick_data):
+    """
+    Convert a list of candlestick dicts into a dict of contiguous 1-D arrays, one per field
+    ("time" as int64, the prices and volume as float64).
+    """
+    n = len(candlestick_data)
+    candles = {"time": np.fromiter((c["time"] for c in candlestick_data), dtype=np.int64, count=n)}
+    for field in CANDLE_FIELDS[1:]:
+        candles[field] = np.fromiter((c[field] for c in candlestick_data), dtype=np.float64, count=n)
+    return candles
+
+
+def _as_soa(candles):
+    """Returns SoA candles unchanged and converts a list of candlestick dicts with candles_to_soa."""
+    if isinstance(candles, dict):
+        return candles
+    return candles_to_soa(candles)
+
+
+def _slice_candles(candles, index):
+    """Applies the same slice or index array to every field of a SoA candle dict."""
+    return {field: values[index] for field, values in candles.items()}
+
+
+def prepare_chart_data(candles, period=0, sma_enabled=False, ema_enabled=False, bb_enabled=False,
+                       rsi_enabled=True, state=None):
+    """
+    Computes the indicator series drawn by the TradingView charts from SoA candles
+    (see candles_to_soa); a list of candlestick dicts is converted first.
+
+    It touches no Qt objects, so it can run in a worker thread. Indicator series are
+    float64 arrays (NaN where undefined) aligned with the candles left after skipping
+    the first `period` ones; disabled indicators are None and never computed.
+
+    `state` is the "state" entry of the previous result for the same chart. When the
+    new candles only change the live candle, or close it and open the next one, the
+    indicators are advanced from it in O(1) instead of recomputed over the whole series.
+    The EMA and RSI are seeded from the first window, so when the window moves they are
+    recomputed by their kernels to stay equal to a full recompute.
+    When only the enabled indicators changed, the series already in `state` are reused
+    and only the newly enabled indicators are computed.
+    """
+    candles = _as_soa(candles)
+    flags = (period, sma_enabled, ema_enabled, bb_enabled, rsi_enabled)
+
+    shift = _candles_shift(state, candles, flags)
+    if shift is None:
+        state = _full_indicator_state(candles, flags, state)
+    else:
+        state = _advance_indicator_state(state, candles, shift)
+
+    series = state["series"]
+    data = {"candles": candles, "sma": None, "ema": None, "bb": None, "rsi": None, "state": state}
+    if "sma" in series:
+        data["sma"] = series["sma"][period:]
+    if "ema" in series:
+        data["ema"] = series["ema"][period:]
+    if "upper" in series:
+        data["bb"] = (series["upper"][period:], series["lower"][period:])
+    if "rsi" in series:
+        data["rsi"] = series["rsi"][period:]
+    return data
+
+
+def _full_indicator_state(candles, flags, previous=None):
+    """
+    Computes every enabled indicator over the whole series, plus the running state at the last closed candle.
+
+    Series in `previous` computed from the same closes and period are reused instead of recomputed.
+    """
+    period, sma_enabled, ema_enabled, bb_enabled, rsi_enabled = flags
+    closes = candles["close"]
+    n = len(closes)
+
+    reusable = {}
+    if (previous is not None and previous["flags"][0] == period
+            and np.array_equal(previous["closes"], closes)):
+        reusable = previous["series"]
+
+    series = {}
+    if sma_enabled:
+        series["sma"] = reusable["sma"] if "sma" in reusable else kernels.sma(closes, period)
+    if ema_enabled:
+        series["ema"] = reusable["ema"] if "ema" in reusable else kernels.ema(closes, period)
+    if bb_enabled:
+        if "upper" in reusable:
+            series["upper"], series["lower"] = reusable["upper"], reusable["lower"]
+        else:
+            series["upper"], series["lower"] = kernels.bollinger_bands(closes, period, _BB_STD_DEV)
+    if rsi_enabled and n > period:
+        series["rsi"] = reusable["rsi"] if "rsi" in reusable else kernels.rsi(closes, period)
+
+    # Running state after the last closed candle (the one before the live candle)
+    closed = None
+    if n >= period + 2:
+        i = n - 2
+        window = closes[i - period + 1:i + 1]
+        avg_gain = avg_loss = 0.0
+        if rsi_enabled:
+            avg_gains, avg_losses = kernels.wilder_averages(closes, period)
+            avg_gain, avg_loss = avg_gains[i], avg_losses[i]
+        closed = {
+            "sma_sum": window.sum(),
+            "ema": series["ema"][i] if ema_enabled else 0.0,
+            "avg_gain": avg_gain,
+            "avg_loss": avg_loss,
+            "bb_mean": window.mean(),
+            "bb_m2": ((window - window.mean()) ** 2).sum(),
+        }
+
+    return {"flags": flags, "times": candles["time"], "closes": closes, "series": series, "closed": closed}
+
+
+def _candles_shift(state, candles, flags):
+    """
+    Compares the new candles with the ones behind `state`: 0 if only the live candle
+    changed, 1 if a candle closed and the window moved by one, None otherwise.
+    """
+    if state is None or state["closed"] is None or state["flags"] != flags:
+        return None
+
+    times = candles["time"]
+    prev_times = state["times"]
+    if len(times) != len(prev_times):
+        return None
+    if times[0] == prev_times[0] and times[-1] == prev_times[-1]:
+        return 0
+    if times[0] == prev_times[1] and times[-2] == prev_times[-1]:
+        return 1
+    return None
+
+
+def _step_indicators(acc, closes, i, period):
+    """Advances the running state by the candle at index i; returns the new state and the indicator values."""
+    new = closes[i]
+    old = closes[i - period]
+
+    sma_sum = acc["sma_sum"] + new - old
+    ema = (new - acc["ema"]) * (2 / (period + 1)) + acc["ema"]
+
+    change = new - closes[i - 1]
+    avg_gain = (acc["avg_gain"] * (period - 1) + max(change, 0.0)) / period
+    avg_loss = (acc["avg_loss"] * (period - 1) + max(-change, 0.0)) / period
+
+    bb_mean = acc["bb_mean"] + (new - old) / period
+    bb_m2 = acc["bb_m2"] + (new - old) * (new - bb_mean + old - acc["bb_mean"])
+    std_dev = (bb_m2 / period) ** 0.5 if bb_m2 > 0 else 0.0
+
+    new_acc = {"sma_sum": sma_sum, "ema": ema, "avg_gain": avg_gain, "avg_loss": avg_loss,
+               "bb_mean": bb_mean, "bb_m2": bb_m2}
+    values = {
+        "sma": sma_sum / period,
+        "ema": ema,
+        "rsi": 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss),
+        "upper": bb_mean + _BB_STD_DEV * std_dev,
+        "lower": bb_mean - _BB_STD_DEV * std_dev,
+    }
+    return new_acc, values
+
+
+def _advance_indicator_state(state, candles, shift):
+    """Reuses the indicator series in `state` and recomputes only the candles that changed."""
+    period = state["flags"][0]
+    closes = candles["close"]
+    n = len(closes)
+
+    # Previous values, moved left by `shift` candles; the last one or two slots are recomputed
+    series = {}
+    for name, prev in state["series"].items():
+        out = np.empty(n)
+        out[:n - 1 - shift] = prev[shift:n - 1]
+        series[name] = out
+
+    acc = state["closed"]
+    if shift:
+        # The previous live candle has closed: fold its final values into the running state
+        acc, values = _step_indicators(acc, closes, n - 2, period)
+        for name, out in series.items():
+            out[n - 2] = values[name]
+
+        # The EMA and RSI are seeded from the first window, which moved with the oldest
+        # candle, so every value changes; re-seed them over the new window
+        if "ema" in series:
+            series["ema"] = kernels.ema(closes, period)
+            acc["ema"] = series["ema"][n - 2]
+        if "rsi" in series:
+            series["rsi"] = kernels.rsi(closes, period)
+            avg_gains, avg_losses = kernels.wilder_averages(closes, period)
+            acc["avg_gain"], acc["avg_loss"] = avg_gains[n - 2], avg_losses[n - 2]
+
+    _, values = _step_indicators(acc, closes, n - 1, period)
+    for name, out in series.items():
+        out[n - 1] = values[name]
+
+    return {"flags": state["flags"], "times": candles["time"], "closes": closes, "series": series, "closed": acc}
+
+
+def _m4_downsample(candles, n_buckets):
+    """
+    M4-style downsampling of SoA candles into at most n_buckets candles.
+
+    Each bucket keeps its entry (first open), min (lowest low), max (highest high) and
+    exit (last close), so the rendered envelope matches drawing every candle.
+    Returns the bucket start indices and the downsampled SoA candles.
+    """
+    n = len(candles["close"])
+    bucket_size = -(-n // n_buckets)  # Ceil division so no more than n_buckets are produced
+    starts = np.arange(0, n, bucket_size)
+    ends = np.minimum(starts + bucket_size, n) - 1
+
+    return starts, {
+        "time": candles["time"][starts],                             # Time of the first candle
+        "open": candles["open"][starts],                             # Entry
+        "high": np.maximum.reduceat(candles["high"], starts),        # Max
+        "low": np.minimum.reduceat(candles["low"], starts),          # Min
+        "close": candles["close"][ends],                             # Exit
+        "volume": np.add.reduceat(candles["volume"], starts),        # Total volume
+    }
+
+
+class CandlestickItem(pg.GraphicsObject):
+    """
+    Graphics item drawing a set of candles.
+
+    The wick lines and body rects are built once per color in set_data. A repaint only
+    draws the candles whose x falls inside the exposed rect, found by binary search on
+    the candle positions, so a partial expose or a zoomed-in view costs O(visible candles)
+    and each color still takes one drawLines and one drawRects call.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Makes Qt pass the exposed rect to paint() instead of the whole bounding rect
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+        self._groups = []  # (pen, brush, x positions, wick lines, body rects) per color
+        self._half_width = 0.0
+        self._bounds = QRectF()
+
+    def set_data(self, candle_x, candles, bar_width):
+        """Replaces the drawn candles; candle_x holds the x position of each SoA candle."""
+        self.prepareGeometryChange()
+        self._groups = []
+        self._half_width = bar_width / 2
+        self._bounds = QRectF()
+
+        if len(candle_x):
+            opens, highs, lows, closes = candles["open"], candles["high"], candles["low"], candles["close"]
+            body_bottoms = np.minimum(opens, closes)
+            body_heights = np.abs(closes - opens)
+            is_up = closes >= opens
+
+            for mask, pen, brush in ((is_up, _PEN_UP, _BRUSH_UP), (~is_up, _PEN_DOWN, _BRUSH_DOWN)):
+                if not mask.any():
+                    continue
+                xs = candle_x[mask]
+                # High-Low lines
+                lines = [QLineF(x, l, x, h) for x, l, h in
+                         zip(xs.tolist(), lows[mask].tolist(), highs[mask].tolist())]
+                # Candlestick bodies
+                rects = [QRectF(x - bar_width / 2, bottom, bar_width, height) for x, bottom, height in
+                         zip(xs.tolist(), body_bottoms[mask].tolist(), body_heights[mask].tolist())]
+                self._groups.append((pen, brush, xs, lines, rects))
+
+            low, high = lows.min(), highs.max()
+            self._bounds = QRectF(candle_x[0] - bar_width / 2, low, candle_x[-1] - candle_x[0] + bar_width, high - low)
+        self.update()
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        left = exposed.left() - self._half_width
+        right = exposed.right() + self._half_width
+        for pen, brush, xs, lines, rects in self._groups:
+            # Candle positions are sorted, so the visible ones form one contiguous slice
+            first = np.searchsorted(xs, left, side="left")
+            last = np.searchsorted(xs, right, side="right")
+            if first >= last:
+                continue
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            painter.drawLines(lines[first:last])
+            painter.drawRects(rects[first:last])
+
+    def boundingRect(self):
+        return self._bounds
+
 
 class CandlestickChart(QWidget):
     def __init__(self):
@@ -18,82 +347,109 @@ class CandlestickChart(QWidget):
         # Create the chart with the custom time axis
         #self.chart = pg.PlotWidget(title="Candlestick Chart", axisItems={'bottom': TimeAxisItem(orientation='bottom')})
         self.chart = pg.PlotWidget(title="Candlestick Chart")
+        # Repaint one bounding rect when many items change instead of one region per item
+        self.chart.setViewportUpdateMode(_viewport_update_mode())
+        self.chart.setDownsampling(auto=True, mode='peak')
+        self.chart.setClipToView(True)
         self.chart.setLabel('bottom', 'Time')
         self.chart.setLabel('left', 'Price')
         layout.addWidget(self.chart)
         self.setLayout(layout)
 
-    def update_chart(self, candlestick_data, period=0, sma_enabled=False, ema_enabled=False, bb_enabled=False):
-        """Updates the chart with candlestick format, adjusted for time gaps, and with indicators."""
-        self.chart.clear()
-
-        if not candlestick_data:
-            return  # Avoid errors if data is empty
-
-        # Extract timestamps & normalize x-axis to fix gaps
-        times = [c["time"] for c in candlestick_data]
-        x_positions = np.arange(len(times)-period)  # Generate sequential indices for x-axis
-
-        # === Add Indicators if Enabled ===
-        if sma_enabled:
-            self.add_sma(period, candlestick_data, x_positions)
-        if ema_enabled:
-            self.add_ema(period, candlestick_data, x_positions)
-        if bb_enabled:
-            self.add_bollinger_bands(period, data=candlestick_data, times=x_positions)
-
-        # Remove period from data
-        candlestick_data = candlestick_data[period:]
-
-        opens = np.array([float(c["open"]) for c in candlestick_data])
-        highs = np.array([float(c["high"]) for c in candlestick_data])
-        lows = np.array([float(c["low"]) for c in candlestick_data])
-        closes = np.array([float(c["close"]) for c in candlestick_data])
+        # Closed candles never change, so they live in an item rasterized once and reused
+        # on pans; only the live (last) candle is redrawn on every update.
+        self._historical_item = CandlestickItem()
+        self._historical_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self._live_item = CandlestickItem()
+        self.chart.addItem(self._historical_item)
+        self.chart.addItem(self._live_item)
+        self._historical_key = None
+
+        # Indicator curves drawn on top of the candles; created once and updated in place,
+        # an indicator that is disabled just has its curve emptied
+        self._overlays = {
+            "sma": self.chart.plot(pen=_PEN_SMA, name="SMA"),
+            "ema": self.chart.plot(pen=_PEN_EMA, name="EMA"),
+            "upper": self.chart.plot(pen=_PEN_BB_UPPER, name="Upper Band"),  # Upper band in green
+            "lower": self.chart.plot(pen=_PEN_BB_LOWER, name="Lower Band"),  # Lower band in red
+        }
+
+    def _clear_chart(self):
+        """Empties the indicator overlays and removes every candle from the chart."""
+        for curve in self._overlays.values():
+            curve.clear()
+
+        empty = {field: np.empty(0) for field in CANDLE_FIELDS}
+        self._historical_item.set_data(np.empty(0), empty, 0)
+        self._live_item.set_data(np.empty(0), empty, 0)
+        self._historical_key = None
+
+    def update_chart(self, candlestick_data, period=0, sma=None, ema=None, bb=None):
+        """
+        Updates the chart with candlestick format, adjusted for time gaps, and with indicators.
+
+        sma, ema and bb (an (upper, lower) pair) are indicator arrays aligned with the
+        candles after the first `period`; None skips that indicator.
+        """
+        self.set_data({"candles": _as_soa(candlestick_data), "sma": sma, "ema": ema, "bb": bb}, period)
+
+    def set_data(self, data, period=0):
+        """Draws candles and indicators already computed by prepare_chart_data."""
+        candles = data["candles"]
+        n = len(candles["close"])
+        if n <= period:
+            self._clear_chart()
+            return  # Avoid errors if there is nothing left to draw after the warm-up candles
+
+        # Normalize x-axis to fix time gaps
+        x_positions = np.arange(n - period)  # Generate sequential indices for x-axis
+
+        # === Update the indicator curves; disabled ones are emptied ===
+        upper_band, lower_band = data["bb"] if data["bb"] is not None else (None, None)
+        overlay_values = {"sma": data["sma"], "ema": data["ema"], "upper": upper_band, "lower": lower_band}
+        for name, curve in self._overlays.items():
+            values = overlay_values[name]
+            if values is None:
+                curve.clear()
+            else:
+                curve.setData(x_positions, values)
+
+        # Skip the indicator warm-up candles with views instead of copying the data
+        candles = _slice_candles(candles, slice(period, None))
 
         # Set a reasonable bar width
         bar_width = 0.7  # Fixed width to maintain equal spacing
-
-        for x, o, h, l, c in zip(x_positions, opens, highs, lows, closes):
-            color = (0, 255, 0) if c >= o else (255, 0, 0)
-
-            # High-Low Line
-            self.chart.plot([x, x], [l, h], pen=pg.mkPen(color, width=1))
-
-            # Candlestick Body
-            body_bottom = min(o, c)
-            body_top = max(o, c)
-            body = QGraphicsRectItem(x - bar_width / 2, body_bottom, bar_width, body_top - body_bottom)
-            body.setBrush(pg.mkBrush(color))
-            body.setPen(pg.mkPen(color))
-            self.chart.addItem(body)
+        candle_x = x_positions
+        bucket_size = 1
+
+        # Downsample when there are many more candles than pixel columns to draw them
+        viewport_width = self.chart.width()
+        if viewport_width > 0 and len(x_positions) > 4 * viewport_width:
+            starts, candles = _m4_downsample(candles, viewport_width)
+            bucket_size = starts[1] - starts[0] if len(starts) > 1 else 1
+            candle_x = starts + (bucket_size - 1) / 2  # Center each bucket over the candles it covers
+            bar_width *= bucket_size
+
+        # Rebuild the cached historical candles only when they actually changed
+        # (new candle closed, different symbol or timeframe, new downsampling). Closed
+        # candles never change, so the count, the first and last times and the last
+        # closed OHLC identify them without comparing every array
+        historical = _slice_candles(candles, slice(None, -1))
+        times = historical["time"]
+        historical_key = (len(times), bucket_size, bar_width)
+        if len(times):
+            historical_key += (int(times[0]), int(times[-1])) + tuple(
+                historical[field][-1].item() for field in ("open", "high", "low", "close"))
+        if historical_key != self._historical_key:
+            self._historical_item.set_data(candle_x[:-1], historical, bar_width)
+            self._historical_key = historical_key
+
+        # The live candle is always redrawn
+        self._live_item.set_data(candle_x[-1:], _slice_candles(candles, slice(-1, None)), bar_width)
 
         # Apply scaling
         self.chart.setXRange(min(x_positions), max(x_positions), padding=0.05)
-        self.chart.setYRange(min(lows), max(highs), padding=0.1)
-
-
-    def add_sma(self, period=20, data=None, times=None):
-        """Calculate and plot the Simple Moving Average."""
-        closing_prices = IndicatorCalculator.extract_closing_prices(data)
-        sma_data = IndicatorCalculator.calculate_sma(period=period, closing_prices=closing_prices)
-        self.chart.plot(times, sma_data, pen=pg.mkPen('blue', width=1), name="SMA")
-
-    def add_ema(self, period=20, data=None, times=None):
-        """Calculate and plot the Exponential Moving Average."""
-        closing_prices = IndicatorCalculator.extract_closing_prices(data)
-        ema_data = IndicatorCalculator.calculate_ema(period, closing_prices)
-        self.chart.plot(times, ema_data[period:], pen=pg.mkPen('orange', width=1), name="EMA")
-    
-    def add_bollinger_bands(self, period=20, std_dev_multiplier=2, data=None, times=None):
-        """Calculate and plot Bollinger Bands."""
-        closing_prices = IndicatorCalculator.extract_closing_prices(data)
-        upper_band, lower_band = IndicatorCalculator.calculate_bollinger_bands(period, std_dev_multiplier, closing_prices)
-        # Plot the upper band in green
-        self.chart.plot(times, upper_band, pen=pg.mkPen('green', width=1), name="Upper Band")
-        # Plot the lower band in red
-        self.chart.plot(times, lower_band, pen=pg.mkPen('red', width=1), name="Lower Band")
-
-   
+        self.chart.setYRange(candles["low"].min(), candles["high"].max(), padding=0.1)
 
 
 class VolumeChart(QWidget):
@@ -102,130 +458,149 @@ class VolumeChart(QWidget):
         layout = QVBoxLayout()
         #self.chart = pg.PlotWidget(title="Volume Chart", axisItems={'bottom': TimeAxisItem(orientation='bottom')})
         self.chart = pg.PlotWidget(title="Volume Chart")
+        self.chart.setViewportUpdateMode(_viewport_update_mode())
+        self.chart.setDownsampling(auto=True, mode='peak')
+        self.chart.setClipToView(True)
         self.chart.setLabel('bottom', 'Time')
         self.chart.setLabel('left', 'Volume')
         layout.addWidget(self.chart)
         self.setLayout(layout)
 
+        # One bar item per color (green for buy, red for sell), so the number of draw calls
+        # does not grow with the number of candles; their data is replaced on every update
+        self._buy_bars = pg.BarGraphItem(x=[], height=[], width=1, brush=_BRUSH_BUY_VOLUME)
+        self._sell_bars = pg.BarGraphItem(x=[], height=[], width=1, brush=_BRUSH_SELL_VOLUME)
+        self.chart.addItem(self._buy_bars)
+        self.chart.addItem(self._sell_bars)
+
     def update_chart(self, candlestick_data, discard_first_n=0):
         """Updates the volume chart with bars using distinct colors for buy/sell and adjusts scale."""
-        self.chart.clear()
+        self.set_data(_as_soa(candlestick_data), discard_first_n)
 
+    def set_data(self, candles, discard_first_n=0):
+        """Draws the volume bars of SoA candles built by candles_to_soa."""
         # Discard the first n candlesticks if specified
-        candlestick_data = candlestick_data[discard_first_n:]
+        candles = _slice_candles(candles, slice(discard_first_n, None))
+
+        # Normalize x-axis to fix gaps
+        x_positions = np.arange(len(candles["close"]))  # Generate sequential indices for x-axis
+        bar_x = x_positions
+        bar_width = 1 
 
-         # Extract timestamps & normalize x-axis to fix gaps
-        times = [c["time"] for c in candlestick_data]
-        x_positions = np.arange(len(times))  # Generate sequential indices for x-axis
+        # Downsample to at most two bars per pixel column; each bar then carries the
+        # total volume of the candles it covers
+        viewport_width = self.chart.width()
+        if viewport_width > 0 and len(x_positions) > 2 * viewport_width:
+            starts, candles = _m4_downsample(candles, 2 * viewport_width)
+            bucket_size = starts[1] - starts[0] if len(starts) > 1 else 1
+            bar_x = starts + (bucket_size - 1) / 2  # Center each bucket over the candles it covers
+            bar_width *= bucket_size
 
         # Extract data
-        volumes = [float(c["volume"]) for c in candlestick_data]  # Volumes
-        is_buy_volume = [float(c["close"]) >= float(c["open"]) for c in candlestick_data]  # Buy/Sell distinction
+        volumes = candles["volume"]
+        is_buy_volume = candles["close"] >= candles["open"]  # Buy/Sell distinction
 
-        bar_width = 1 
+        # Update the bars in place
+        self._buy_bars.setOpts(x=bar_x[is_buy_volume], height=volumes[is_buy_volume], width=bar_width)
+        self._sell_bars.setOpts(x=bar_x[~is_buy_volume], height=volumes[~is_buy_volume], width=bar_width)
+
+        # Adjust the chart's scale
+        if len(volumes):
+            self.chart.setXRange(x_positions[0], x_positions[-1], padding=0.05)
+            self.chart.setYRange(0, volumes.max() * 1.1, padding=0.1)
 
-        # Create brushes for colors (green for buy, red for sell)
-        brushes = [
-            pg.mkBrush(0, 255, 0, 150) if buy else pg.mkBrush(255, 0, 0, 150)
-            for buy in is_buy_volume
-        ]
 
-        # Plot bars
-        bars = pg.BarGraphItem(x=x_positions, height=volumes, width=bar_width, brushes=brushes)
-        self.chart.addItem(bars)
 
-        # Adjust the chart's scale
-        if times and volumes:
-            self.chart.setXRange(min(x_positions), max(x_positions), padding=0.05)
-            self.chart.setYRange(0, max(volumes) * 1.1, padding=0.1)
+def _cumulative_volumes(volumes):
+    """Running total of the order book volumes, scanned in parallel only for very deep books."""
+    if len(volumes) > _PARALLEL_CUMSUM_MIN_LEVELS:
+        return kernels.parallel_cumsum(volumes)
+    return np.cumsum(volumes)
 
 
+def prepare_depth_data(depth_data):
+    """
+    Computes the cumulative order book drawn by DepthChart from the API depth data
+    ({'bids': [[price, qty], ...], 'asks': [...]}, prices and quantities as strings).
+
+    Like prepare_chart_data it touches no Qt objects, so it can run in a worker thread.
+    Bids are sorted by descending price and asks by ascending price, each with the
+    running total of the volumes from the best price outwards.
+    """
+    depth = {}
+    for side, descending in (("bid", True), ("ask", False)):
+        rows = depth_data[side + "s"]
+        levels = np.array(rows, dtype=np.float64).reshape(len(rows), 2)  # Parses the numeric strings
+        order = np.argsort(levels[:, 0])
+        if descending:
+            order = order[::-1]
+        depth[side + "_prices"] = levels[order, 0]
+        depth[side + "_volumes"] = _cumulative_volumes(levels[order, 1])
+    return depth
+
 
 class DepthChart(QWidget):
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout()
         self.chart = pg.PlotWidget(title="Depth Chart")
+        self.chart.setViewportUpdateMode(_viewport_update_mode())
+        self.chart.setDownsampling(auto=True, mode='peak')
+        self.chart.setClipToView(True)
         self.chart.setLabel('bottom', 'Price')
         self.chart.setLabel('left', 'Cumulative Volume')
         self.chart.addLegend()
         layout.addWidget(self.chart)
         self.setLayout(layout)
 
+        # Bid and ask curves, created once and updated in place
+        self._bid_curve = self.chart.plot(pen=_PEN_BIDS, fillLevel=0, brush=(50, 200, 50, 100), name="Bids")
+        self._ask_curve = self.chart.plot(pen=_PEN_ASKS, fillLevel=0, brush=(200, 50, 50, 100), name="Asks")
+
     def update_chart(self, depth_data, discard_first_n=0):
-        """Updates the depth chart with cumulative data and adjusts scale."""
-        self.chart.clear()
-    
-       # Discard the first n entries from bids and asks
-        bids = sorted(depth_data['bids'][discard_first_n:], key=lambda x: float(x[0]), reverse=True)
-        asks = sorted(depth_data['asks'][discard_first_n:], key=lambda x: float(x[0]))
-
-        # Extract and sort data
-        bids = sorted(depth_data['bids'], key=lambda x: float(x[0]), reverse=True)  # Descending prices
-        asks = sorted(depth_data['asks'], key=lambda x: float(x[0]))  # Ascending prices
-
-        bid_prices = [float(b[0]) for b in bids]
-        bid_volumes = [float(b[1]) for b in bids]
-        ask_prices = [float(a[0]) for a in asks]
-        ask_volumes = [float(a[1]) for a in asks]
-
-        # Calculate cumulative volumes
-        cumulative_bid_volumes = [sum(bid_volumes[:i + 1]) for i in range(len(bid_volumes))]
-        cumulative_ask_volumes = [sum(ask_volumes[:i + 1]) for i in range(len(ask_volumes))]
-
-        # Plot bids
-        bid_plot = self.chart.plot(
-            bid_prices,
-            cumulative_bid_volumes,
-            pen=pg.mkPen('g', width=2),
-            fillLevel=0,
-            brush=(50, 200, 50, 100),
-            name="Bids"
-        )
-
-        # Plot asks
-        ask_plot = self.chart.plot(
-            ask_prices,
-            cumulative_ask_volumes,
-            pen=pg.mkPen('r', width=2),
-            fillLevel=0,
-            brush=(200, 50, 50, 100),
-            name="Asks"
-        )
+        """Updates the depth chart with cumulative data and adjusts scale; the whole book is drawn."""
+        self.set_data(prepare_depth_data(depth_data))
+
+    def set_data(self, depth):
+        """Draws the cumulative book computed by prepare_depth_data."""
+        # Update bids and asks
+        self._bid_curve.setData(depth["bid_prices"], depth["bid_volumes"])
+        self._ask_curve.setData(depth["ask_prices"], depth["ask_volumes"])
 
         # Adjust the chart's scale
-        all_prices = bid_prices + ask_prices
-        all_volumes = cumulative_bid_volumes + cumulative_ask_volumes
-        if all_prices and all_volumes:
-            self.chart.setXRange(min(all_prices), max(all_prices), padding=0.1)
-            self.chart.setYRange(0, max(all_volumes) * 1.1, padding=0.1)
+        all_prices = np.concatenate((depth["bid_prices"], depth["ask_prices"]))
+        all_volumes = np.concatenate((depth["bid_volumes"], depth["ask_volumes"]))
+        if len(all_prices):
+            self.chart.setXRange(all_prices.min(), all_prices.max(), padding=0.1)
+            self.chart.setYRange(0, all_volumes.max() * 1.1, padding=0.1)
 
 
 class RSIChart(QWidget):
     def __init__(self):
         super().__init__()
         self.chart = pg.PlotWidget(title="Relative Strength Index (RSI)")
+        self.chart.setViewportUpdateMode(_viewport_update_mode())
+        self.chart.setDownsampling(auto=True, mode='peak')
+        self.chart.setClipToView(True)
         self.chart.setLabel('left', 'RSI')
         self.chart.setLabel('bottom', 'Time')
 
+        # The RSI curve and the overbought (70) / oversold (30) lines are created once
+        # and only their data changes on each update
+        self._rsi_curve = self.chart.plot(pen=_PEN_RSI)
+        self.chart.addLine(y=70, pen=_PEN_OB)  # Overbought line
+        self.chart.addLine(y=30, pen=_PEN_OS)  # Oversold line
+
         layout = QVBoxLayout()
         layout.addWidget(self.chart)
         self.setLayout(layout)
 
     def update_chart(self, candlesticks, period=14):
-        
-        closing_prices = IndicatorCalculator.extract_closing_prices(candlesticks)
-
-        # Calculate RSI from the price data
-        rsi = IndicatorCalculator.calculate_rsi(period, closing_prices)
-
-        # Discard the first n candlesticks if specified
-        rsi = rsi[period:]
+        closing_prices = _as_soa(candlesticks)["close"]
 
-        # Plot the RSI data
-        self.chart.clear()  # Clear the previous plot
-        self.chart.plot(rsi, pen=pg.mkPen('purple', width=2), name=f'RSI ({period})')
+        # Calculate RSI from the price data, discarding the first n candlesticks
+        self.set_data(kernels.rsi(closing_prices, period)[period:], period)
 
-        # Add overbought (70) and oversold (30) lines
-        self.chart.addLine(y=70, pen=pg.mkPen('red', width=1, style=Qt.DashLine))  # Overbought line
-        self.chart.addLine(y=30, pen=pg.mkPen('green', width=1, style=Qt.DashLine))  # Oversold line
\ No newline at end of file
+    def set_data(self, rsi, period=14):
+        """Draws an RSI series that already skips the warm-up candles."""
+        self._rsi_curve.setData(rsi, name=f'RSI ({period})')
\ No newline at end of file
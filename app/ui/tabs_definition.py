@@ -1,12 +1,138 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QLabel,
     QPushButton, QLineEdit, QTabWidget, QFormLayout, QSplitter,
-    QCheckBox, QRadioButton, QTableWidget, QTableWidgetItem
+    QCheckBox, QRadioButton, QTableWidget, QTableWidgetItem, QTableView
 )
-from PyQt5.QtGui import QColor
-from app.ui.charts import CandlestickChart, VolumeChart, DepthChart, RSIChart
-from PyQt5.QtCore import pyqtSignal,Qt
+from PyQt5.QtGui import QColor, QBrush
+import numpy as np
+from app.ui.charts import CandlestickChart, VolumeChart, DepthChart, RSIChart, CANDLE_FIELDS, prepare_chart_data, prepare_depth_data
+from PyQt5.QtCore import pyqtSignal,Qt,QObject,QRunnable,QAbstractTableModel,QModelIndex
 from app.utils.logger import setup_logger
+from app.ui._workers import pool
+
+
+class _ChartPrepSignals(QObject):
+    """Signals used by _ChartPrepTask to hand its results back to the GUI thread."""
+    finished = pyqtSignal(int, object, int)  # request id, chart data, period
+    failed = pyqtSignal(int, str)  # request id, error message
+
+
+class _ChartPrepTask(QRunnable):
+    """
+    Computes the indicators and the cumulative depth for TradingViewTab off the GUI thread.
+
+    With candlesticks None only the depth is prepared, for refreshes whose candles didn't change.
+    """
+
+    def __init__(self, signals, request_id, candlesticks, depth, period, sma_enabled, ema_enabled, bb_enabled,
+                 rsi_enabled, indicator_state=None):
+        super().__init__()
+        self.signals = signals
+        self.request_id = request_id
+        self.candlesticks = candlesticks
+        self.depth = depth
+        self.period = period
+        self.sma_enabled = sma_enabled
+        self.ema_enabled = ema_enabled
+        self.bb_enabled = bb_enabled
+        self.rsi_enabled = rsi_enabled
+        self.indicator_state = indicator_state
+
+    def run(self):
+        try:
+            data = {}
+            if self.candlesticks is not None:
+                data = prepare_chart_data(self.candlesticks, self.period,
+                                          self.sma_enabled, self.ema_enabled, self.bb_enabled,
+                                          self.rsi_enabled, self.indicator_state)
+            data["depth"] = prepare_depth_data(self.depth) if self.depth is not None else None
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+            return
+        self.signals.finished.emit(self.request_id, data, self.period)
+
+
+def _candles_key(candles):
+    """
+    Fingerprint of SoA candles, or None when there are none.
+
+    Closed candles never change, so the length, the first time and the live candle
+    are enough to recognize the same data.
+    """
+    times = candles["time"]
+    if not len(times):
+        return None
+    return (len(times), int(times[0])) + tuple(candles[field][-1].item() for field in CANDLE_FIELDS)
+
+
+def _best_levels(order_book_data, levels=5):
+    """Returns the best order book levels: highest bids first, then lowest asks first."""
+    bid_rows = order_book_data['bids']
+    ask_rows = order_book_data['asks']
+    bid_prices = np.fromiter((float(b[0]) for b in bid_rows), dtype=np.float64, count=len(bid_rows))
+    ask_prices = np.fromiter((float(a[0]) for a in ask_rows), dtype=np.float64, count=len(ask_rows))
+    bids = [bid_rows[i] for i in np.argsort(bid_prices)[::-1][:levels]]  # Descending prices
+    asks = [ask_rows[i] for i in np.argsort(ask_prices)[:levels]]  # Ascending prices
+    return bids, asks
+
+
+class _OrderBookPrepSignals(QObject):
+    """Signals used by _OrderBookPrepTask to hand its results back to the GUI thread."""
+    finished = pyqtSignal(int, object, object)  # request id, bids, asks
+    failed = pyqtSignal(int, str)  # request id, error message
+
+
+class _OrderBookPrepTask(QRunnable):
+    """Parses and sorts an order book snapshot for OrdersTab off the GUI thread."""
+
+    def __init__(self, signals, request_id, order_book_data):
+        super().__init__()
+        self.signals = signals
+        self.request_id = request_id
+        self.order_book_data = order_book_data
+
+    def run(self):
+        try:
+            bids, asks = _best_levels(self.order_book_data)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+            return
+        self.signals.finished.emit(self.request_id, bids, asks)
+
+
+# Dark mode styles of TradingViewTab. The EMA and SMA checkboxes are colored like their
+# chart lines while checked, through their "active" dynamic property (see update_checkbox).
+_TRADING_VIEW_STYLE = """
+    QRadioButton {
+        color: white;
+        background-color: transparent;
+    }
+    QRadioButton::indicator {
+        border: 1px solid #444444;
+        background-color: #2e2e2e;
+    }
+    QRadioButton::indicator:checked {
+        background-color: #444444;
+    }
+    QCheckBox {
+        color: white;
+        background-color: transparent;
+    }
+    QCheckBox::indicator {
+        border: 1px solid #444444;
+        background-color: #2e2e2e;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #444444;
+    }
+    QCheckBox#ema_checkbox[active="true"] {
+        color: orange;
+    }
+    QCheckBox#sma_checkbox[active="true"] {
+        color: blue;
+    }
+"""
+
 
 class TradingViewTab(QWidget):
     need_update = pyqtSignal()  # Signal to call update in main window
@@ -20,6 +146,18 @@ class TradingViewTab(QWidget):
         else:
             self.logger = logger
         
+        # Indicator computations run in the shared UI pool; only the result of the latest request is drawn
+        self._pool = pool
+        self._prep_request_id = 0
+        self._ind_state = None  # Running indicator state of the last drawn data, see prepare_chart_data
+
+        # Inputs of the last drawn update, see update; an identical refresh is skipped
+        self._last_update_key = None
+        self._pending_update_key = None
+        self._prep_signals = _ChartPrepSignals()
+        self._prep_signals.finished.connect(self._on_chart_data_ready)
+        self._prep_signals.failed.connect(self._on_chart_data_failed)
+
         # Initialize ui
         self.init_ui()
 
@@ -44,7 +182,9 @@ class TradingViewTab(QWidget):
 
         # Checkboxes for indicators
         self.sma_checkbox = QCheckBox("SMA (Simple Moving Average)")
+        self.sma_checkbox.setObjectName("sma_checkbox")
         self.ema_checkbox = QCheckBox("EMA (Exponential Moving Average)")
+        self.ema_checkbox.setObjectName("ema_checkbox")
         self.rsi_checkbox = QCheckBox("RSI (Relative Strength Index)")
         self.bollinger_checkbox = QCheckBox("Bollinger Bands")
 
@@ -57,11 +197,11 @@ class TradingViewTab(QWidget):
         # Charts definition
         self.candlestick_chart = CandlestickChart()
         self.volume_chart = VolumeChart()
-        self.depth_chart = DepthChart()
 
-        # Initialize RSI chart widget (Initially hidden)
-        self.rsi_chart = RSIChart()
-        self.rsi_chart.setVisible(False)  
+        # Depth and RSI charts are created the first time they have something to show
+        self.depth_chart = None
+        self.rsi_chart = None
+        self._last_rsi = None  # Latest RSI series and period, drawn when the RSI chart is created
         
         # Radio buttons for different intervals
         self.radio_buttons_layout = QHBoxLayout()
@@ -87,11 +227,11 @@ class TradingViewTab(QWidget):
         self.radio_buttons_layout.addWidget(self.radio_1d)
         self.radio_buttons_layout.addStretch()
 
-        # Connect radio buttons to the function that handles the selection
-        self.radio_15m.toggled.connect(self.update_interval)
-        self.radio_1h.toggled.connect(self.update_interval)
-        self.radio_4h.toggled.connect(self.update_interval)
-        self.radio_1d.toggled.connect(self.update_interval)
+        # Connect radio buttons to the function that handles the selection. They're connected
+        # after the default is checked, so building the tab doesn't emit an interval change
+        self._radio_intervals = {self.radio_15m: '15m', self.radio_1h: '1h', self.radio_4h: '4h', self.radio_1d: '1d'}
+        for radio_button in self._radio_intervals:
+            radio_button.toggled.connect(self.update_interval)
 
         # Add candlestick chart
 
@@ -99,8 +239,7 @@ class TradingViewTab(QWidget):
         charts_left_layout.addLayout(self.radio_buttons_layout)
         charts_left_layout.addWidget(self.candlestick_chart)
         charts_left_layout.addWidget(self.volume_chart)
-        charts_left_layout.addWidget(self.depth_chart)
-        charts_left_layout.addWidget(self.rsi_chart)
+        self._charts_left_layout = charts_left_layout
 
         # Add to main layout
         self.main_H_layout.addLayout(charts_left_layout)
@@ -127,153 +266,142 @@ class TradingViewTab(QWidget):
         """
         Apply dark mode to the entire application and customize radio buttons and checkboxes.
         """
-        self.radio_button_style = """
-            QRadioButton {
-                color: white;
-                background-color: transparent;
-            }
-            QRadioButton::indicator {
-                border: 1px solid #444444;
-                background-color: #2e2e2e;
-            }
-            QRadioButton::indicator:checked {
-                background-color: #444444;
-            }
-        """
-
-        # Define a common stylesheet for checkboxes
-        self.checkbox_style = """
-            QCheckBox {
-                color: white;
-                background-color: transparent;
-            }
-            QCheckBox::indicator {
-                border: 1px solid #444444;
-                background-color: #2e2e2e;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #444444;
-            }
-        """
-
-        # List of all radio buttons
-        radio_buttons = [self.radio_15m, self.radio_1h, self.radio_4h, self.radio_1d]
-
-        # Apply the style to each radio button
-        for radio_button in radio_buttons:
-            radio_button.setStyleSheet(self.radio_button_style)
-
-        # List of all checkboxes (replace with your actual checkboxes)
-        checkboxes = [self.sma_checkbox, self.ema_checkbox, self.rsi_checkbox, self.bollinger_checkbox]  
-
-        # Apply the style to each checkbox
-        for checkbox in checkboxes:
-            checkbox.setStyleSheet(self.checkbox_style)
+        # Apply the styles once at the tab root; the radio buttons and checkboxes inherit them
+        self.setStyleSheet(_TRADING_VIEW_STYLE)
 
     def update(self, candlesticks, depth, rsi_period):
         """
         Update the tab's content using the provided data.
+
+        candlesticks are SoA candles (see candles_to_soa), converted by DataUpdateWorker when
+        they are fetched. Only the indicators checked in the tab are computed, in the tab's
+        thread pool; the charts are drawn in _on_chart_data_ready once the results are back on
+        the GUI thread. When the candles, period and checkboxes are the same as in the last
+        drawn update, only the depth chart is refreshed; the order book changes on almost
+        every tick and is cheap to prepare, so it isn't compared.
         """
-        try:
-            # Update candlestick chart
-            try:
-                self.candlestick_chart.update_chart(candlesticks, rsi_period, 
-                                                    self.sma_checkbox.isChecked(),
-                                                    self.ema_checkbox.isChecked(),
-                                                    self.bollinger_checkbox.isChecked())                    
-                self.logger.info("Candlestick chart updated successfully.")
-            except Exception as e:
-                self.logger.error(f"Failed to update candlestick chart: {e}")
-                self.show_error_message(f"Candlestick chart error: {e}")
-            
-            # Update volume chart
-            try:
-                self.volume_chart.update_chart(candlesticks, rsi_period)
-                self.logger.info("Volume chart updated successfully.")
-            except Exception as e:
-                self.logger.error(f"Failed to update volume chart: {e}")
-                self.show_error_message(f"Volume chart error: {e}")
+        candles_key = _candles_key(candlesticks)
+        flags = (self.sma_checkbox.isChecked(), self.ema_checkbox.isChecked(),
+                 self.bollinger_checkbox.isChecked(), self.rsi_checkbox.isChecked())
+        key = (candles_key, rsi_period, flags)
+        if candles_key is not None and key == self._last_update_key:
+            if depth is None:
+                self.logger.debug("Chart inputs unchanged, skipping update.")
+                return
+            self.logger.debug("Candles unchanged, updating the depth chart only.")
+            candlesticks = None
+        else:
+            self._pending_update_key = key
 
-            # Update depth chart
-            try:
-                if(depth==None):
-                    self.depth_chart.setVisible(False)
-                else:
-                    self.depth_chart.setVisible(True)
-                    self.depth_chart.update_chart(depth, rsi_period)
-                    self.logger.info("Depth chart updated successfully.")
-            except Exception as e:
-                self.logger.error(f"Failed to update depth chart: {e}")
-                self.show_error_message(f"Depth chart error: {e}")
-            
-            # Update RSI chart if there is enough data
+        self._prep_request_id += 1
+        self._pool.start(_ChartPrepTask(self._prep_signals, self._prep_request_id, candlesticks, depth, rsi_period,
+                                        *flags, self._ind_state))
+
+    def _on_chart_data_failed(self, request_id, message):
+        """Reports an indicator computation error from the thread pool."""
+        if request_id != self._prep_request_id:
+            return
+        self._last_update_key = None
+        self.logger.error("Failed to prepare chart data: %s", message)
+        self.show_error_message(f"Chart data error: {message}")
+
+    def _on_chart_data_ready(self, request_id, data, rsi_period):
+        """Draws the charts with the data computed by _ChartPrepTask."""
+        if request_id != self._prep_request_id:
+            return  # A newer update is on its way
+
+        # A failing chart is reported and skipped; the others are still drawn
+        steps = (("Depth", lambda: self._draw_depth_chart(data["depth"])),)
+        if "candles" in data:
+            self._ind_state = data["state"]
+            self._last_update_key = self._pending_update_key
+            steps = (("Candlestick", lambda: self.candlestick_chart.set_data(data, rsi_period)),
+                     ("Volume", lambda: self.volume_chart.set_data(data["candles"], rsi_period)),
+                     steps[0],
+                     ("RSI", lambda: self._draw_rsi_chart(data["rsi"], rsi_period)))
+        for name, draw in steps:
             try:
-                if len(candlesticks) > rsi_period:  # Ensure there's enough data for the default RSI period (14)
-                    self.rsi_chart.update_chart(candlesticks, period=rsi_period)
-                    self.logger.info("RSI chart updated successfully.")
-                else:
-                    self.logger.warning("Not enough candlestick data to update RSI chart.")
+                draw()
             except Exception as e:
-                self.logger.error(f"Failed to update RSI chart: {e}")
-                self.show_error_message(f"RSI chart error: {e}")
-            
-            self.logger.info(f"Charts updated.")
+                self.logger.error("Failed to update %s chart: %s", name, e)
+                self.show_error_message(f"{name} chart error: {e}")
+        self.logger.debug("Charts updated.")
+
+    def _draw_depth_chart(self, depth):
+        """Shows the depth chart with the book from prepare_depth_data, creating it on first use, or hides it when depth is None."""
+        if depth is None:
+            if self.depth_chart is not None:
+                self.depth_chart.setVisible(False)
+            return
+        if self.depth_chart is None:
+            # Goes right below the volume chart, above the RSI chart if it exists
+            self.depth_chart = DepthChart()
+            index = self._charts_left_layout.indexOf(self.volume_chart) + 1
+            self._charts_left_layout.insertWidget(index, self.depth_chart)
+        self.depth_chart.setVisible(True)
+        self.depth_chart.set_data(depth)
+
+    def _draw_rsi_chart(self, rsi, rsi_period):
+        """Draws the RSI series when it was computed; it is None when disabled or there's too little data."""
+        if rsi is None:
+            if self.rsi_checkbox.isChecked():
+                self.logger.warning("Not enough candlestick data to update RSI chart.")
+            return
+        self._last_rsi = (rsi, rsi_period)
+        if self.rsi_chart is not None:
+            self.rsi_chart.set_data(rsi, period=rsi_period)
 
-        except Exception as e:
-            self.logger.critical(f"Critical error during chart update: {e}")
-            self.show_error_message(f"Critical error: {str(e)}")
-    
     def update_interval(self):
         """Updates the candlestick chart interval based on selected radio button."""
-        if self.radio_15m.isChecked():
-            new_selected_interval = '15m'
-        elif self.radio_1h.isChecked():
-            new_selected_interval = '1h'
-        elif self.radio_4h.isChecked():
-            new_selected_interval = '4h'
-        elif self.radio_1d.isChecked():
-            new_selected_interval = '1d'
+        # Each change toggles two radio buttons; only the one being checked matters
+        sender = self.sender()
+        if sender in self._radio_intervals:
+            if not sender.isChecked():
+                return
+            new_selected_interval = self._radio_intervals[sender]
+        else:
+            new_selected_interval = next(interval for radio_button, interval in self._radio_intervals.items()
+                                         if radio_button.isChecked())
 
         if new_selected_interval != self.selected_interval:
             self.selected_interval=new_selected_interval
             self.interval_changed.emit(self.selected_interval)
 
     def call_update_main_window(self):
-        """call to start_main_window_update"""
-        self.logger.info(f"Call to start_main_window_update from TradingViewTab.")
+        """call to start_main_window_update (debounced by the main window)"""
+        self.logger.info("Call to start_main_window_update from TradingViewTab.")
         self.need_update.emit()
 
     def update_checkbox(self):
-        if self.ema_checkbox.isChecked():
-            checkbox_style = """
-                                QCheckBox {
-                                    color: orange;  /* Text color */
-                                    background-color: transparent;
-                                }
-                            """
-            self.ema_checkbox.setStyleSheet(checkbox_style)
-        else:
-            self.ema_checkbox.setStyleSheet(self.checkbox_style)
-        
-        if self.sma_checkbox.isChecked():
-            checkbox_style = """
-                                QCheckBox {
-                                    color: blue;  /* Text color */
-                                    background-color: transparent;
-                                }
-                            """
-            self.sma_checkbox.setStyleSheet(checkbox_style)
-        else:
-            self.sma_checkbox.setStyleSheet(self.checkbox_style)
+        # Color the EMA and SMA checkboxes like their chart lines while checked
+        for checkbox in (self.ema_checkbox, self.sma_checkbox):
+            checked = checkbox.isChecked()
+            if checkbox.property("active") != checked:
+                checkbox.setProperty("active", checked)
+                # Re-evaluate the tab style for the new property value
+                checkbox.style().unpolish(checkbox)
+                checkbox.style().polish(checkbox)
 
         self.call_update_main_window()
 
     def toggle_rsi(self):
+        # The RSI is only computed while it is shown, so enabling it needs fresh data
+        if self.rsi_checkbox.isChecked():
+            self.call_update_main_window()
+
+        if self.rsi_chart is None:
+            if not self.rsi_checkbox.isChecked():
+                return
+            self.rsi_chart = RSIChart()
+            self._charts_left_layout.addWidget(self.rsi_chart)
+            if self._last_rsi is not None:
+                rsi, period = self._last_rsi
+                self.rsi_chart.set_data(rsi, period=period)
         self.rsi_chart.setVisible(self.rsi_checkbox.isChecked())
 
     def show_error_message(self, message):
         """Placeholder for actual error message handling in UI."""
-        self.logger.warning(f"Error: {message}")
+        self.logger.warning("Error: %s", message)
 
 
 
@@ -287,6 +415,24 @@ class OrdersTab(QWidget):
             self.logger = setup_logger()
         else:
             self.logger = logger
+
+        # Order book brushes, shared by every update (a QBrush skips the QColor conversion in setForeground)
+        self._bid_brush = QBrush(QColor("green"))
+        self._ask_brush = QBrush(QColor("red"))
+
+        # Longest price/quantity text the columns were last sized for
+        self._order_book_text_widths = None
+
+        # Order book snapshots are sorted in the shared UI pool; only the latest one is shown
+        self._pool = pool
+        self._order_book_request_id = 0
+        self._order_book_signals = _OrderBookPrepSignals()
+        self._order_book_signals.finished.connect(self._on_order_book_ready)
+        self._order_book_signals.failed.connect(self._on_order_book_failed)
+
+        # Inputs of the last update; quiet markets often return the same data tick after tick
+        self._last_open_orders = None
+        self._last_order_book = None
         
         # Initialize ui
         self.init_ui()
@@ -385,6 +531,12 @@ class OrdersTab(QWidget):
         self.order_book.setHorizontalHeaderLabels(["Price", "Qty"])
         self.order_book.setSortingEnabled(False)  # Allow sorting by clicking headers
 
+        # 5 bid rows and 5 ask rows; the cell items are created once and reused on every update
+        self.order_book.setRowCount(10)
+        for r in range(10):
+            for c in range(2):
+                self.order_book.setItem(r, c, QTableWidgetItem())
+
         right_side_layout = QVBoxLayout()
         self.order_book_label = QLabel("Order Book")
         right_side_layout.addWidget(self.order_book_label)
@@ -492,56 +644,79 @@ class OrdersTab(QWidget):
     def update(self, open_orders=None, order_book_data=None):
         """
         Update the tab's content using the provided data.
+
+        :param open_orders: List of Order objects.
+        :param order_book_data: Depth data with 'bids' and 'asks', or None to hide the order book.
         """
-        if order_book_data == None:
-            bids=[]
-            asks=[]
-            self.order_book.setVisible(False)
-            self.order_book_label.setVisible(False)
-        else:
-            self.order_book.setVisible(True)
-            self.order_book_label.setVisible(True)
-            
-            # Extract and sort data
-            bids = sorted(order_book_data['bids'], key=lambda x: float(x[0]), reverse=True)  # Descending prices
-            asks = sorted(order_book_data['asks'], key=lambda x: float(x[0]))  # Ascending prices
+        if order_book_data is None or order_book_data != self._last_order_book:
+            self._last_order_book = order_book_data
+            self._order_book_request_id += 1
+            if order_book_data == None:
+                self.order_book.setVisible(False)
+                self.order_book_label.setVisible(False)
+                self._fill_order_book([], [])
+            else:
+                self.order_book.setVisible(True)
+                self.order_book_label.setVisible(True)
+                self._pool.start(_OrderBookPrepTask(self._order_book_signals, self._order_book_request_id, order_book_data))
+
+        if open_orders == self._last_open_orders:
+            return
+        self._last_open_orders = open_orders
 
-            bids=bids[len(bids)-5:]
-            asks=asks[len(asks)-5:]
+        # Update my orders, inserting every row at once and repainting only at the end
+        items = [f"{order.side} | Price: {order.price} | Qty: {order.orig_qty}" for order in open_orders] or ["None open orders"]
+        self.orders_list.setUpdatesEnabled(False)
+        self.orders_list.clear()
+        self.orders_list.addItems(items)
+        self.orders_list.setUpdatesEnabled(True)
 
-        self.order_book.setRowCount(10)
+    def _on_order_book_failed(self, request_id, message):
+        """Reports an order book parsing error from the thread pool."""
+        if request_id != self._order_book_request_id:
+            return
+        self._last_order_book = None  # Let the next update retry
+        self.logger.error("Failed to prepare order book: %s", message)
+
+    def _on_order_book_ready(self, request_id, bids, asks):
+        """Shows the order book levels selected by _OrderBookPrepTask."""
+        if request_id != self._order_book_request_id:
+            return  # A newer snapshot is on its way
+        self._fill_order_book(bids, asks)
+
+    def _fill_order_book(self, bids, asks):
+        """Writes the bid and ask levels into the order book table."""
+        # Fill the table without repainting or notifying on every cell
+        self.order_book.setUpdatesEnabled(False)
+        self.order_book.blockSignals(True)
+
+        item = self.order_book.item
         row=0
-        color=QColor("green")
-        for bid in bids:
-            item_bid_price = QTableWidgetItem(bid[0])
-            item_bid_price.setForeground(color)  
-            item_bid_qty = QTableWidgetItem(bid[1])
-            item_bid_qty.setForeground(color)  
-            self.order_book.setItem(row, 0, item_bid_price)
-            self.order_book.setItem(row, 1, item_bid_qty)
-            row+=1
-            
-        color=QColor("red")
-        for ask in asks:
-            item_ask_price = QTableWidgetItem(ask[0])
-            item_ask_price.setForeground(color)  
-            item_ask_qty = QTableWidgetItem(ask[1])
-            item_ask_qty.setForeground(color)  
-            self.order_book.setItem(row, 0, item_ask_price)
-            self.order_book.setItem(row, 1, item_ask_qty)
-            row+=1
-
-        # Resize columns to fit contents
-        self.order_book.resizeColumnsToContents()
-        
-        # Update my orders
-        self.orders_list.clear()
-        if(len(open_orders)):
-            for order in open_orders:
-                item = f"{order['side']} | Price: {order['price']} | Qty: {order['origQty']}"
-                self.orders_list.addItem(item)
-        else:
-            self.orders_list.addItem("None open orders")
+        for rows, brush in ((bids, self._bid_brush), (asks, self._ask_brush)):
+            for price, qty in rows:
+                item_price = item(row, 0)
+                item_price.setText(price)
+                item_price.setForeground(brush)
+                item_qty = item(row, 1)
+                item_qty.setText(qty)
+                item_qty.setForeground(brush)
+                row+=1
+
+        # Blank the rows left over when a side has fewer than 5 levels
+        for r in range(row, 10):
+            self.order_book.item(r, 0).setText("")
+            self.order_book.item(r, 1).setText("")
+
+        self.order_book.blockSignals(False)
+        self.order_book.setUpdatesEnabled(True)
+        self.order_book.viewport().update()
+
+        # Resize columns to fit contents, only when the widest text changed
+        text_widths = (max((len(r[0]) for r in bids + asks), default=0),
+                       max((len(r[1]) for r in bids + asks), default=0))
+        if text_widths != self._order_book_text_widths:
+            self.order_book.resizeColumnsToContents()
+            self._order_book_text_widths = text_widths
 
     def emit_order_request(self):
         """
@@ -574,11 +749,42 @@ class OrdersTab(QWidget):
             self.order_requested.emit(order_details)
 
             # Optionally, you could log the order request
-            self.logger.info(f"Order requested by UI: {side} {quantity} @ {price}")
+            self.logger.info("Order requested by UI: %s %s @ %s", side, quantity, price)
 
         except Exception as e:
             # Handle any exceptions and log the error
-            self.logger.error(f"Failed to emit order request: {e}")
+            self.logger.error("Failed to emit order request: %s", e)
+
+
+class _BalanceModel(QAbstractTableModel):
+    """Read-only table model over a list of (asset, balance) rows."""
+    _HEADERS = ("Asset", "Balance")
+
+    def __init__(self, rows=None):
+        super().__init__()
+        self._rows = rows or []
+
+    def set_rows(self, rows):
+        """Replaces every row with a single model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class BalanceTab(QWidget):
@@ -592,6 +798,9 @@ class BalanceTab(QWidget):
             self.logger = setup_logger()
         else:
             self.logger = logger
+
+        # Balances shown by the table, see update
+        self._last_balances = None
         
         # Initialize ui
         self.init_ui()
@@ -610,14 +819,14 @@ class BalanceTab(QWidget):
         layout.addWidget(self.balance_label)
 
         # Balance Table
-        self.balance_table = QTableWidget(self)
-        self.balance_table.setColumnCount(2)  # Asset and Balance
-        self.balance_table.setHorizontalHeaderLabels(["Asset", "Balance"])
-        layout.addWidget(self.balance_table)
+        self.balance_model = _BalanceModel()  # Asset and Balance
+        self.balance_view = QTableView(self)
+        self.balance_view.setModel(self.balance_model)
+        layout.addWidget(self.balance_view)
 
         # Set custom row height and column width for better readability
-        self.balance_table.verticalHeader().setDefaultSectionSize(30)  # Row height
-        self.balance_table.horizontalHeader().setStretchLastSection(True)  # Stretch the last column
+        self.balance_view.verticalHeader().setDefaultSectionSize(30)  # Row height
+        self.balance_view.horizontalHeader().setStretchLastSection(True)  # Stretch the last column
 
         # Set layout
         self.setLayout(layout)
@@ -632,13 +841,13 @@ class BalanceTab(QWidget):
                 font-size: 16px;
                 font-weight: bold;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #2b2b2b;
                 color: white;
                 gridline-color: gray;
                 border: 1px solid gray;
             }
-            QTableWidget::item {
+            QTableView::item {
                 background-color: #2b2b2b;
                 color: white;
             }
@@ -658,15 +867,15 @@ class BalanceTab(QWidget):
             balances (dict): A dictionary where the keys are asset symbols (e.g., "BTC")
                             and the values are their respective balances.
         """
+        if balances == self._last_balances:
+            return  # Same balances as the last refresh; the table already shows them
         try:
-            self.balance_table.setRowCount(len(balances))  # Set row count
-
-            for row, (asset, balance) in enumerate(balances.items()):
-                self.balance_table.setItem(row, 0, QTableWidgetItem(asset))  # Asset
-                self.balance_table.setItem(row, 1, QTableWidgetItem(str(balance)))  # Balance
+            # One model reset for the whole table instead of a view update per cell
+            self.balance_model.set_rows([(asset, str(balance)) for asset, balance in balances.items()])
+            self._last_balances = balances
             
-            self.logger.info(f"Balance table updated.")
+            self.logger.debug("Balance table updated.")
 
         except Exception as e:
-            self.logger.error(f"Error updating balances: {e}")
+            self.logger.error("Error updating balances: %s", e)
             
\ No newline at end of file
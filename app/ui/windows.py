@@ -1,59 +1,276 @@
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
+import queue
+from dataclasses import dataclass
+from enum import IntEnum
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import Qt, QEvent, QTimer, QThread, QSignalBlocker, QStringListModel, QSortFilterProxyModel, pyqtSignal
 from PyQt5.QtWidgets import QMainWindow, QVBoxLayout, QWidget, QLabel, QComboBox, QLineEdit, QTabWidget, QHBoxLayout, QMessageBox
 from PyQt5.QtGui import QPalette, QColor
 from PyQt5.QtGui import QIcon
 from app.api.api_manager import APIManager
 from app.utils.config import ConfigLoader
 from app.ui.tabs_definition import TradingViewTab, OrdersTab, BalanceTab
+from app.ui.charts import candles_to_soa
 from app.utils.logger import setup_logger
 from app.strategies.strategy_manager import StrategyManager
 from app.strategies.strategies import ThreeScreenStrategy
+from app.utils.order import Order
+
+# Request that tells DataUpdateWorker to stop refreshing
+_PAUSE = object()
+
+# Style of the window's own widgets, set once on the window instead of on each widget;
+# the selector inputs and info labels are matched by object name so the tabs are unaffected
+_MAIN_WINDOW_STYLE = """
+    QComboBox#api_selector, QLineEdit#search_input, QComboBox#pair_selector {
+        color: white;
+        background-color: #2e2e2e;
+    }
+    QLabel#info_label {
+        color: white;
+    }
+    QTabWidget::pane {
+        border: 1px solid #444444;
+        background-color: #2e2e2e;
+    }
+    QTabWidget::tab-bar {
+        alignment: center;
+    }
+    QTabWidget::tab {
+        background-color: #2e2e2e;
+        color: white;
+        padding: 5px;
+        margin-right: 5px;
+        border: 1px solid #444444;
+    }
+    QTabWidget::tab:selected {
+        background-color: #444444;
+    }
+"""
+
+# Shortest search text that filters the trading pair dropdown
+_MIN_FILTER_LENGTH = 2
+
+# Order book levels fetched per side; the depth limit counts price levels, not candles
+_DEPTH_LEVELS = 100
+
+class Tab(IntEnum):
+    """Tabs of the main window, valued by their position in the tab widget."""
+    TRADING_VIEW = 0
+    ORDERS = 1
+    BALANCE = 2
+
+
+@dataclass(frozen=True)
+class TabData:
+    """
+    Data fetched by DataUpdateWorker for one refresh of a tab; fields the tab doesn't use are None.
+
+    Emitted as a single object, declared with __slots__ so each refresh carries no
+    per-instance __dict__.
+    """
+    __slots__ = ("tab", "candles", "depth", "rsi_period", "orders", "balance")
+
+    tab: Tab
+    candles: dict  # SoA candles, see candles_to_soa
+    depth: dict
+    rsi_period: int
+    orders: list  # Order objects
+    balance: dict
+
 
 class DataUpdateWorker(QThread):
-    update_tab = pyqtSignal(object, object, object, object, object)
+    """
+    Long-lived thread that fetches the data shown by the main window.
+
+    Requests are queued with submit(); only the latest pending request is kept, so
+    updates asked for while a fetch is running collapse into a single follow-up fetch.
+    Every signal carries the id of the request it answers, so the receiver can drop
+    results of a fetch that was already outdated when it finished.
+
+    The thread also drives the periodic refresh: while it waits for a new request it
+    re-runs the last one every refresh interval, measured from a monotonic deadline so
+    slow fetches don't make the ticks drift. The Balance tab, whose data only changes
+    with the user's own trades, is refreshed on a longer interval, while the small
+    ticker behind the pair info is refreshed more often on its own. pause() stops the
+    refreshes until the next submit().
+    """
+    update_tab = pyqtSignal(int, object)  # request id, TabData
+
+    pair_info_fetched = pyqtSignal(int, object, object)  # request id, SymbolInfo, ticker info
 
-    error_occurred = pyqtSignal(str)
+    error_occurred = pyqtSignal(int, str)
 
-    def __init__(self, api_manager, trading_pair, interval='1h', selected_tab="TradingView"):
+    def __init__(self, api_manager, num_candles=100, rsi_period=14, refresh_interval_ms=5000,
+                 balance_refresh_interval_ms=30000, info_refresh_interval_ms=1000):
         super().__init__()
         self.api_manager = api_manager
-        self.trading_pair = trading_pair
-        self.interval = interval
-        self.selected_tab=selected_tab
 
-        # Initialize the config loader
-        config = ConfigLoader("app/utils/config/config.json")
+        # Values resolved from the configuration by the window that owns the worker
+        self.num_candles = num_candles
+        self.rsi_period = rsi_period
+        self.refresh_interval = refresh_interval_ms / 1000
+        self.balance_refresh_interval = balance_refresh_interval_ms / 1000
+        self.info_refresh_interval = info_refresh_interval_ms / 1000
 
-        # Retrieve values from the configuration
-        self.num_candles = config.get("num_candles", 100)
-        self.rsi_period = config.get("indicators_period", 14)
-    
-    def emit_update_tab(self, candlesticks_data=None, depth_data=None, rsi_period_data=None, orders_data=None, balance_data=None):
-        # Emit the signal, providing default None values where necessary
-        self.update_tab.emit(candlesticks_data, depth_data, rsi_period_data, orders_data, balance_data)
+        # Pending request: (request id, trading pair, interval, selected tab), _PAUSE to stop
+        # the periodic refresh, or None to stop the thread
+        self._requests = queue.Queue(maxsize=1)
+
+        # The REST calls of one fetch are independent, so they run concurrently and a
+        # fetch takes as long as the slowest call instead of the sum of all of them
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
+        # Candles of the last TradingView fetch and their (api, pair, interval); when the API
+        # supports it, later fetches only ask for the candles from the last one onwards
+        self._candles_key = None
+        self._candles = []
+
+    def submit(self, request_id, trading_pair, interval='1h', selected_tab=Tab.TRADING_VIEW):
+        """Queues a fetch, replacing the pending one if the previous fetch hasn't picked it up yet."""
+        self._replace_request((request_id, trading_pair, interval, selected_tab))
+
+    def pause(self):
+        """Stops refreshing the last request; the next submit() resumes the refreshes."""
+        self._replace_request(_PAUSE)
+
+    def stop(self, timeout_ms=2000):
+        """
+        Asks the thread to finish and waits up to timeout_ms for it.
 
+        REST calls that haven't started are cancelled; a call already in flight can't
+        be interrupted, so on a stalled network the thread is left to end on its own
+        once its request times out, instead of blocking the caller until then.
+        """
+        self._replace_request(None)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if not self.wait(timeout_ms):
+            self.api_manager.logger.warning("Data worker still busy after %d ms; leaving it to finish.", timeout_ms)
+
+    def _replace_request(self, request):
+        try:
+            self._requests.get_nowait()  # Drop the stale pending request
+        except queue.Empty:
+            pass
+        self._requests.put_nowait(request)
+    
     def run(self):
+        request = None  # Last request, re-run on every refresh tick
+        deadline = info_deadline = None
+        while True:
+            timeout = None
+            if request is not None:
+                timeout = max(0.0, min(deadline, info_deadline) - time.monotonic())
+            try:
+                pending = self._requests.get(timeout=timeout)
+            except queue.Empty:
+                # Refresh tick: the whole tab when it's due, otherwise only the cheap pair info
+                if deadline <= info_deadline:
+                    fetch, interval = self.fetch, self._refresh_interval(request)
+                    deadline += interval
+                else:
+                    fetch, interval = self.fetch_pair_info, self.info_refresh_interval
+                    info_deadline += interval
+            else:
+                if pending is None:
+                    break
+                if pending is _PAUSE:
+                    request = None
+                    continue
+                # A new request is fetched now and its refreshes are scheduled from here
+                request = pending
+                fetch, interval = self.fetch, self._refresh_interval(request)
+                deadline = time.monotonic() + interval
+            if fetch == self.fetch:
+                # The fetch brings the pair info too
+                info_deadline = time.monotonic() + self.info_refresh_interval
+            try:
+                fetch(*request)
+            except Exception as e:
+                # Keep the thread alive for the next request whatever went wrong
+                self.error_occurred.emit(request[0], str(e))
+
+            now = time.monotonic()
+            if fetch == self.fetch and deadline < now:
+                # The fetch overran its next tick; skip it instead of fetching back to back
+                deadline = now + interval
+            if info_deadline < now:
+                info_deadline = now + self.info_refresh_interval
+
+    def _fetch_trading_view(self, trading_pair, interval):
+        limit = self.num_candles + self.rsi_period
+        depth = self._executor.submit(self.api_manager.get_depth_data, trading_pair, limit=_DEPTH_LEVELS)
+        candlesticks = self._executor.submit(self._fetch_candles, trading_pair, interval, limit)
+        # Convert once here, off the GUI thread; the charts and indicators use the SoA arrays
+        candlestick_data = candles_to_soa(candlesticks.result())
+        return TabData(Tab.TRADING_VIEW, candlestick_data, depth.result(), self.rsi_period, None, None)
+
+    def _fetch_candles(self, trading_pair, interval, limit):
+        """Returns the latest `limit` candles, fetching only the new ones when the last fetch can be extended."""
+        key = (self.api_manager.api_name, trading_pair, interval)
+        if key == self._candles_key and self._candles and self.api_manager.supports_start_time():
+            # The last cached candle may have been live, so it is fetched again along with the newer ones
+            new = self.api_manager.get_candlestick_data(trading_pair, interval=interval, limit=limit,
+                                                        start_time=self._candles[-1]["time"])
+            if new and len(new) < limit:
+                first_new = new[0]["time"]
+                candles = [c for c in self._candles if c["time"] < first_new] + new
+                self._candles = candles[-limit:]
+                return self._candles
+            # A full page means the cached candles are too old to extend; start over
+
+        candles = self.api_manager.get_candlestick_data(trading_pair, interval=interval, limit=limit)
+        self._candles_key, self._candles = key, candles
+        return candles
+
+    def _fetch_orders(self, trading_pair, interval):
+        depth = self._executor.submit(self.api_manager.get_depth_data, trading_pair, limit=_DEPTH_LEVELS)
+        orders = self._executor.submit(self.api_manager.get_open_orders, trading_pair)
+        orders_data = [Order.from_dict(order) for order in orders.result()]
+        return TabData(Tab.ORDERS, None, depth.result(), None, orders_data, None)
+
+    def _fetch_balance(self, trading_pair, interval):
+        return TabData(Tab.BALANCE, None, None, None, None, self.api_manager.get_account_balances())
+
+    def _refresh_interval(self, request):
+        """Seconds between two refreshes of request."""
+        return self.balance_refresh_interval if request[3] == Tab.BALANCE else self.refresh_interval
+
+    def fetch(self, request_id, trading_pair, interval, selected_tab):
+        """Fetches the data of the selected tab and the trading pair info, and emits them."""
+        # Start every request of this fetch before waiting on any of them
+        pair_info = self._submit_pair_info(trading_pair)
+        fetch_tab = {Tab.TRADING_VIEW: self._fetch_trading_view,
+                     Tab.ORDERS: self._fetch_orders,
+                     Tab.BALANCE: self._fetch_balance}[selected_tab]
+
         try:
-            if self.selected_tab=="TradingView" or self.selected_tab=="Orders":
-                depth = self.api_manager.get_depth_data(self.trading_pair, limit=(self.num_candles+self.rsi_period))
-                
-                if self.selected_tab=="TradingView":
-                    # Fetch candlestick and depth data
-                    candlesticks = self.api_manager.get_candlestick_data(self.trading_pair, interval=self.interval, limit=(self.num_candles+self.rsi_period))
-                    # Emit the data
-                    self.emit_update_tab(candlesticks_data=candlesticks, depth_data=depth, rsi_period_data=self.rsi_period)
-                if self.selected_tab=="Orders":
-                    orders = self.api_manager.get_open_orders(self.trading_pair)
-                    # Emit the data
-                    self.emit_update_tab(orders_data=orders, depth_data=depth)
-            if self.selected_tab=="Balance":
-                balance = self.api_manager.get_account_balances()
-                # Emit the data
-                self.emit_update_tab(balance_data=balance)
-            
+            self.update_tab.emit(request_id, fetch_tab(trading_pair, interval))
         except Exception as e:
             # Emit the error
-            self.error_occurred.emit(str(e))
+            self.error_occurred.emit(request_id, str(e))
+
+        self._emit_pair_info(request_id, trading_pair, pair_info)
+
+    def fetch_pair_info(self, request_id, trading_pair, interval=None, selected_tab=None):
+        """
+        Fetches and emits only the trading pair info (symbol and ticker).
+
+        It runs on the pair info schedule, so the ticker always comes from the API
+        instead of APIManager's short-lived ticker cache.
+        """
+        self._emit_pair_info(request_id, trading_pair, self._submit_pair_info(trading_pair, use_cache=False))
+
+    def _submit_pair_info(self, trading_pair, use_cache=True):
+        return (self._executor.submit(self.api_manager.get_symbol_info, trading_pair),
+                self._executor.submit(self.api_manager.get_ticker_info, trading_pair, use_cache=use_cache))
+
+    def _emit_pair_info(self, request_id, trading_pair, pair_info):
+        symbol_info, ticker_info = pair_info
+        try:
+            self.pair_info_fetched.emit(request_id, symbol_info.result(), ticker_info.result())
+        except Exception as e:
+            self.error_occurred.emit(request_id, f"Failed to fetch info for {trading_pair}: {e}")
 
 class MainWindow(QMainWindow):
     def __init__(self, logger=None):
@@ -66,6 +283,8 @@ class MainWindow(QMainWindow):
         self.num_candles = config.get("num_candles", 100)
         self.rsi_period = config.get("indicators_period", 14)
         self.timer_interval = config.get("timer_interval_ms", 5000)
+        self.balance_timer_interval = config.get("balance_timer_interval_ms", 30000)
+        self.pair_info_timer_interval = config.get("pair_info_timer_interval_ms", 1000)
 
         # Set the window icon
         self.setWindowIcon(QIcon('app/resources/AppIcon.ico'))
@@ -78,12 +297,41 @@ class MainWindow(QMainWindow):
             self.logger = setup_logger()
         else:
             self.logger = logger
+        # Messages logged on every periodic refresh; setup_logger rate-limits this child logger only
+        self.refresh_logger = self.logger.getChild("refresh")
 
         # Initialize API manager
         self.api_manager = APIManager(logger=self.logger)
+        # The set of API clients is fixed once the manager is built
+        self.api_clients = self.api_manager.get_api_clients_list()
+
+        # Start the data worker; it lives as long as the window, fetches on request and
+        # refreshes the last request every timer_interval_ms (balance_timer_interval_ms on the Balance tab)
+        # and its pair info every pair_info_timer_interval_ms.
+        # Only the results for the current pair, interval and tab are shown
+        self._request_id = 0
+        self._request_selection = None
+        self.chart_worker = DataUpdateWorker(self.api_manager, self.num_candles, self.rsi_period, self.timer_interval,
+                                             self.balance_timer_interval, self.pair_info_timer_interval)
+        self.chart_worker.update_tab.connect(self.update_main_window)
+        self.chart_worker.pair_info_fetched.connect(self.update_pair_info)
+        self.chart_worker.error_occurred.connect(self.handle_update_main_window_error)
+        self.chart_worker.start()
 
-        # Initialize the chart worker
-        self.chart_worker = None
+        # Debounce timer: bursts of UI events (typing in the search box, toggling checkboxes,
+        # switching intervals) collapse into a single main window update
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self.start_main_window_update)
+
+        # How the data of each tab is shown; the Orders and Balance tabs are looked up when called
+        # since they are built on first selection
+        self._show_tab_data = {
+            Tab.TRADING_VIEW: lambda data: self.trading_view_tab.update(data.candles, data.depth, data.rsi_period),
+            Tab.ORDERS: lambda data: self.orders_tab.update(open_orders=data.orders, order_book_data=data.depth),
+            Tab.BALANCE: lambda data: self.balance_Tab.update(balances=data.balance),
+        }
 
         # Default candlestick interval
         self.selected_interval = '1h'
@@ -93,14 +341,9 @@ class MainWindow(QMainWindow):
 
         # Apply dark mode to the window
         self.apply_dark_mode()
-        
-        # Start a timer to update charts every 5 seconds
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.start_main_window_update)
-        self.update_timer.start(self.timer_interval)
 
         # Select the first item in the list of api clients
-        self.select_api(self.api_manager.get_api_clients_list()[0])
+        self.select_api(self.api_clients[0])
 
         # Define strategy intervals for Three-Screen Strategy
         long_term_interval = "1d"
@@ -110,7 +353,7 @@ class MainWindow(QMainWindow):
         # Create the Three-Screen Strategy instance
         three_screen_strategy = ThreeScreenStrategy(
             api_manager=self.api_manager,
-            "binance",
+            api_name="binance",
             long_term_interval=long_term_interval,
             mid_term_interval=mid_term_interval,
             short_term_interval=short_term_interval,
@@ -122,16 +365,16 @@ class MainWindow(QMainWindow):
         strategy_manager.register_strategy("Binance_ThreeScreen", three_screen_strategy)
 
     def select_api(self, api_name):
-        self.reset_update_timer()
-
         self.api_manager.set_api(api_name)
 
-        self.trading_pairs = self.api_manager.get_trading_symbols()
-        self.filtered_pairs = self.trading_pairs[:]  # Copy for filtering 
+        # The pair list only changes with the API, so it is kept immutable
+        self.trading_pairs = tuple(self.api_manager.get_trading_symbols())
 
-        # Update dropdown for selecting trading pair
-        self.pair_selector.clear()
-        self.pair_selector.addItems(self.trading_pairs)
+        # Update dropdown for selecting trading pair; the pair is selected explicitly below,
+        # so the transient selections of the model reset are not reported
+        blocker = QSignalBlocker(self.pair_selector)
+        self.pairs_proxy.setFilterFixedString("")
+        self.pairs_model.setStringList(list(self.trading_pairs))
         if "BTCUSDC" in self.trading_pairs:
             self.current_pair = "BTCUSDC" 
         elif "BTC/USDC" in self.trading_pairs:
@@ -139,17 +382,12 @@ class MainWindow(QMainWindow):
         else:
             self.trading_pairs[0]
         self.pair_selector.setCurrentText(self.current_pair)
+        blocker.unblock()
 
         # Default pair for binance
 
-        self.start_main_window_update()
+        self._debounce.start()
 
-    def reset_update_timer(self):
-        """Stop and restart the update timer"""
-        self.update_timer.stop()  
-        self.update_timer.start(self.timer_interval)
-        self.logger.info("Update timer has been reset.")
-        
     def apply_dark_mode(self):
         """Apply dark mode to the entire application and customize radio buttons and checkboxes."""
         palette = QPalette()
@@ -179,9 +417,9 @@ class MainWindow(QMainWindow):
 
         # Dropdown for selecting API
         self.api_selector = QComboBox()
-        self.api_selector.addItems(self.api_manager.get_api_clients_list())
-        self.api_selector.setCurrentText(self.api_manager.get_api_clients_list()[0])
-        self.api_selector.setStyleSheet("color: white; background-color: #2e2e2e;")
+        self.api_selector.addItems(self.api_clients)
+        self.api_selector.setCurrentText(self.api_clients[0])
+        self.api_selector.setObjectName("api_selector")
         self.api_selector.currentTextChanged.connect(self.on_api_changed)
         top_layout.addWidget(QLabel("Select API:"))
         top_layout.addWidget(self.api_selector)
@@ -189,15 +427,19 @@ class MainWindow(QMainWindow):
         # Search input
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search trading pairs...")
-        self.search_input.setStyleSheet("color: white; background-color: #2e2e2e;")
+        self.search_input.setObjectName("search_input")
         self.search_input.textChanged.connect(self.filter_pairs)
         top_layout.addWidget(self.search_input)
 
         # Dropdown for selecting trading pair
         self.pair_selector = QComboBox()
-        #self.pair_selector.addItems(self.trading_pairs)
-        #self.pair_selector.setCurrentText(self.current_pair)
-        self.pair_selector.setStyleSheet("color: white; background-color: #2e2e2e;")
+        # All the pairs of the API stay in one model; the search only changes the proxy filter
+        self.pairs_model = QStringListModel()
+        self.pairs_proxy = QSortFilterProxyModel()
+        self.pairs_proxy.setSourceModel(self.pairs_model)
+        self.pairs_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.pair_selector.setModel(self.pairs_proxy)
+        self.pair_selector.setObjectName("pair_selector")
         self.pair_selector.currentTextChanged.connect(self.on_pair_changed)
         top_layout.addWidget(QLabel("Select Trading Pair:"))
         top_layout.addWidget(self.pair_selector)
@@ -208,19 +450,19 @@ class MainWindow(QMainWindow):
         self.info_panel_2 = QHBoxLayout()
 
         self.name_label = QLabel("Name: -")
-        self.name_label.setStyleSheet("color: white;")
+        self.name_label.setObjectName("info_label")
         self.exchange_label = QLabel("Exchange: -")
-        self.exchange_label.setStyleSheet("color: white;")
+        self.exchange_label.setObjectName("info_label")
 
         self.info_panel_1.addWidget(self.name_label)
         self.info_panel_1.addWidget(self.exchange_label)
 
         self.price_label = QLabel("Price: -")
-        self.price_label.setStyleSheet("color: white;")
+        self.price_label.setObjectName("info_label")
         self.high_low_label = QLabel("24h High/Low: -")
-        self.high_low_label.setStyleSheet("color: white;")
+        self.high_low_label.setObjectName("info_label")
         self.volume_label = QLabel("24h Volume: -")
-        self.volume_label.setStyleSheet("color: white;")
+        self.volume_label.setObjectName("info_label")
 
         self.info_panel_2.addWidget(self.price_label)
         self.info_panel_2.addWidget(self.high_low_label)
@@ -236,42 +478,18 @@ class MainWindow(QMainWindow):
         # Tab widget for charts
         self.tab_widget = QTabWidget()
 
-        # Set the tab's background and borders for dark mode
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #444444;
-                background-color: #2e2e2e;
-            }
-            QTabWidget::tab-bar {
-                alignment: center;
-            }
-            QTabWidget::tab {
-                background-color: #2e2e2e;
-                color: white;
-                padding: 5px;
-                margin-right: 5px;
-                border: 1px solid #444444;
-            }
-            QTabWidget::tab:selected {
-                background-color: #444444;
-            }
-        """)
-
         self.trading_view_tab = TradingViewTab(logger=self.logger)
         self.tab_widget.addTab(self.trading_view_tab, "Trading View")
 
         # Connect signal of trading view tab
         self.trading_view_tab.interval_changed.connect(self.update_interval)
-        self.trading_view_tab.need_update.connect(self.start_main_window_update)
+        self.trading_view_tab.need_update.connect(self._debounce.start)
 
-        self.orders_tab = OrdersTab(logger=self.logger)
-        self.tab_widget.addTab(self.orders_tab, "Orders")
-
-        # Connect the OrdersTab signal to the main window's order creation handler
-        self.orders_tab.order_requested.connect(self.handle_order_request)
-
-        self.balance_Tab = BalanceTab(logger=self.logger)
-        self.tab_widget.addTab(self.balance_Tab, "Balance")
+        # The Orders and Balance tabs are built the first time they are selected, see handle_tab_change
+        self.orders_tab = None
+        self.balance_Tab = None
+        self._lazy_tabs = {self.tab_widget.addTab(QWidget(), "Orders"): self._build_orders_tab,
+                           self.tab_widget.addTab(QWidget(), "Balance"): self._build_balance_tab}
 
         # Connect the tab change signal to a handler
         self.tab_widget.currentChanged.connect(self.handle_tab_change)
@@ -287,21 +505,40 @@ class MainWindow(QMainWindow):
         central_widget.setLayout(layout)
         self.setCentralWidget(central_widget)
 
+        # Dark mode for the selectors, info labels and tab widget, resolved in one pass
+        self.setStyleSheet(_MAIN_WINDOW_STYLE)
+
     def handle_tab_change(self, index, update=True):
         """
         Handles tab change events and updates only the visible tab.
         """
-        current_tab = self.tab_widget.widget(index)
-        if current_tab == self.trading_view_tab:
-            self.tab_selected="TradingView"
-        elif current_tab == self.orders_tab:
-            self.tab_selected="Orders"
-        elif current_tab == self.balance_Tab:
-            self.tab_selected="Balance"
+        build_tab = self._lazy_tabs.pop(index, None)
+        if build_tab is not None:
+            # Swap the placeholder for the real tab without reporting the transient tab changes
+            blocker = QSignalBlocker(self.tab_widget)
+            placeholder = self.tab_widget.widget(index)
+            label = self.tab_widget.tabText(index)
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, build_tab(), label)
+            self.tab_widget.setCurrentIndex(index)
+            blocker.unblock()
+            placeholder.deleteLater()
+
+        self.tab_selected = Tab(index)
         
         if(update):
             self.start_main_window_update()
 
+    def _build_orders_tab(self):
+        self.orders_tab = OrdersTab(logger=self.logger)
+        # Connect the OrdersTab signal to the main window's order creation handler
+        self.orders_tab.order_requested.connect(self.handle_order_request)
+        return self.orders_tab
+
+    def _build_balance_tab(self):
+        self.balance_Tab = BalanceTab(logger=self.logger)
+        return self.balance_Tab
+
     def handle_order_request(self, order_details):
         """
         Handles the order request signal from the OrdersTab and places the order using the API.
@@ -329,20 +566,25 @@ class MainWindow(QMainWindow):
     def update_interval(self, new_interval):
         self.logger.info(f"Interval has been updated ({self.selected_interval}->{new_interval}).")
         self.selected_interval = new_interval
-        self.start_main_window_update()
+        self._debounce.start()
 
     def filter_pairs(self, search_text):
         """Filters the trading pairs in the dropdown based on search input."""
-        search_text = search_text.upper()  # Ensure case-insensitivity
-        self.filtered_pairs = [pair for pair in self.trading_pairs if search_text in pair]
-
-        # Update the dropdown
-        self.pair_selector.clear()
-        self.pair_selector.addItems(self.filtered_pairs)
+        # Queries shorter than two characters match nearly every pair, so they show the full list
+        pattern = search_text.strip().upper()
+        if len(pattern) < _MIN_FILTER_LENGTH:
+            pattern = ""
+        if pattern == self.pairs_proxy.filterRegExp().pattern():
+            return  # Same filter as before (e.g. only the case changed); nothing to redo
+
+        # Filter the dropdown without reporting the selections it goes through meanwhile
+        blocker = QSignalBlocker(self.pair_selector)
+        self.pairs_proxy.setFilterFixedString(pattern)  # Case-insensitive
+        self.pair_selector.setCurrentIndex(0)
+        blocker.unblock()
 
         # Reset to the first filtered pair or clear if none match
-        if self.filtered_pairs:
-            self.pair_selector.setCurrentIndex(0)
+        if self.pairs_proxy.rowCount():
             self.on_pair_changed(self.pair_selector.currentText())
         else:
             self.on_pair_changed("")  # Clear the charts if no match
@@ -354,55 +596,78 @@ class MainWindow(QMainWindow):
     def on_pair_changed(self, trading_pair):
         """Handles change in trading pair selection."""
         self.current_pair = trading_pair
-        self.start_main_window_update()
+        self._debounce.start()
 
-    def update_pair_info(self):
-        """Fetches and updates the trading pair information."""
+    def update_pair_info(self, request_id, symbol_info, info):
+        """Shows the trading pair information fetched by the data worker."""
+        if request_id != self._request_id:
+            return  # Info of a pair or tab that is no longer selected
         try:
-            SelectedSymbol=self.api_manager.get_symbol_info(self.current_pair)
-            self.name_label.setText(f"Name: {SelectedSymbol.name}")
-            self.exchange_label.setText(f"Exchange: {SelectedSymbol.exchange}")
+            self.name_label.setText(f"Name: {symbol_info.name}")
+            self.exchange_label.setText(f"Exchange: {symbol_info.exchange}")
             
-            info = self.api_manager.get_ticker_info(self.current_pair)
             # Assume `info` contains: {'price': float, 'high': float, 'low': float, 'volume': float}
             self.price_label.setText(f"Price: {info['price']:.2f}")
             self.high_low_label.setText(f"24h High/Low: {info['high']:.2f} / {info['low']:.2f}")
             self.volume_label.setText(f"24h Volume: {info['volume']:.2f}")
-            self.logger.info(f"Updated pair info for {self.current_pair}.")
+            self.refresh_logger.info("Updated pair info for %s.", self.current_pair)
         except Exception as e:
             self.logger.error(f"Failed to update pair info: {e}")
             self.show_error_message(f"Failed to fetch info for {self.current_pair}")
 
     def start_main_window_update(self):
-        """Starts the main window update process in a background thread."""
-        self.reset_update_timer()
+        """Asks the data worker to fetch, and from then on refresh, the current selection."""
+        if self.isMinimized() or not self.isVisible():
+            self.chart_worker.pause()
+            return  # Nothing on screen to update; changeEvent catches up when the window is restored
         if not self.current_pair:
+            self.chart_worker.pause()
             self.logger.warning("No trading pair selected to update main window.")
             return
 
-        if self.chart_worker and self.chart_worker.isRunning():
-            self.logger.warning("main window update is already in progress. Skipping this update.")
-            return
-
-        self.logger.info(f"Starting main window update for {self.current_pair} with interval {self.selected_interval}.")
-        self.chart_worker = DataUpdateWorker(self.api_manager, self.current_pair, self.selected_interval, self.tab_selected)
-        self.chart_worker.update_tab.connect(self.update_main_window)
-        self.chart_worker.error_occurred.connect(self.handle_update_main_window_error)
-        self.chart_worker.start()
-
-    def update_main_window(self, candlesticks=None, depth=None, rsi_period=None, orders=None, balance=None):
-        self.logger.info(f"Window update showing {self.tab_selected} information.")
-        if (self.tab_selected=="TradingView"):
-            self.trading_view_tab.update(candlesticks, depth, rsi_period)
-        if (self.tab_selected=="Orders"):
-            self.orders_tab.update(open_orders=orders, order_book_data=depth)
-        if (self.tab_selected=="Balance"):
-            self.balance_Tab.update(balances=balance)
-        
-        self.update_pair_info()
-
-    def handle_update_main_window_error(self, error_message):
+        self.refresh_logger.info("Starting main window update for %s with interval %s.", self.current_pair, self.selected_interval)
+        selection = (self.current_pair, self.selected_interval, self.tab_selected)
+        if selection != self._request_selection:
+            # A new selection outdates every fetch still running; periodic refreshes keep the id
+            self._request_id += 1
+            self._request_selection = selection
+        self.chart_worker.submit(self._request_id, self.current_pair, self.selected_interval, self.tab_selected)
+
+    def update_main_window(self, request_id, data):
+        """Shows the TabData fetched by the data worker in its tab."""
+        if request_id != self._request_id:
+            return  # Data of a pair, interval or tab that is no longer selected
+        self.refresh_logger.info("Window update showing %s information.", data.tab.name)
+        self._show_tab_data[data.tab](data)
+
+    def changeEvent(self, event):
+        """Pauses the refreshes while minimized and refreshes the window as soon as it's restored."""
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.chart_worker.pause()
+            elif event.oldState() & Qt.WindowMinimized:
+                self._debounce.start()
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        """Starts the updates once the window is on screen."""
+        self._debounce.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Pauses the refreshes while the window is hidden."""
+        self.chart_worker.pause()
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        """Stops the data worker before the window closes."""
+        self.chart_worker.stop()
+        super().closeEvent(event)
+
+    def handle_update_main_window_error(self, request_id, error_message):
         """Handles errors that occur during main window update."""
+        if request_id != self._request_id:
+            return
         self.logger.error(f"Chart update error: {error_message}")
         self.show_error_message(error_message)
 
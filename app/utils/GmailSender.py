@@ -5,12 +5,53 @@ from email.mime.application import MIMEApplication
 from app.utils.logger import setup_logger
 from app.utils.config import ConfigLoader
 import os
+import time
+
+# Gmail drops SMTP sessions that stay idle for a few minutes
+_SMTP_IDLE_TIMEOUT_S = 240
 
 class EmailSender:
     def __init__(self, logger=None):
         self.logger = logger if logger else setup_logger()
         self.config = ConfigLoader("app/utils/config/config.json")
         self.enabled = self.config.get("email_notifications")
+        self._smtp = None
+        self._last_used = 0.0
+
+    def _connect(self):
+        """Open an authenticated SMTP session, replacing any previous one."""
+        self.close()
+        server = smtplib.SMTP('smtp.gmail.com', 587)
+        server.starttls()
+        server.login(self.config['email']['sender'], self.config['email']['password'])
+        self._smtp = server
+        return server
+
+    def _get_connection(self):
+        """Return the open SMTP session, reconnecting when it has been idle too long."""
+        if self._smtp is None or time.monotonic() - self._last_used > _SMTP_IDLE_TIMEOUT_S:
+            return self._connect()
+        return self._smtp
+
+    def close(self):
+        """Close the SMTP session if one is open."""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except OSError:
+                # SMTPException is an OSError; a dead session cannot be closed cleanly
+                pass
+            self._smtp = None
+
+    def _sendmail(self, message):
+        sender = self.config['email']['sender']
+        recipient = self.config['email']['recipient']
+        try:
+            self._get_connection().sendmail(sender, recipient, message)
+        except smtplib.SMTPServerDisconnected:
+            # The server closed the session on its side; log in again and retry once
+            self._connect().sendmail(sender, recipient, message)
+        self._last_used = time.monotonic()
 
     def send_notification(self, subject, body, attachments=None):
         if self.enabled:
@@ -28,12 +69,9 @@ class EmailSender:
                         part['Content-Disposition'] = f'attachment; filename="{os.path.basename(attachment)}"'
                         msg.attach(part)
 
-                server = smtplib.SMTP('smtp.gmail.com', 587)
-                server.starttls()
-                server.login(self.config['email']['sender'], self.config['email']['password'])
-                server.sendmail(self.config['email']['sender'], self.config['email']['recipient'], msg.as_string())
-                server.quit()
+                self._sendmail(msg.as_string())
 
                 self.logger.info("Email notification sent with CSV attachments.")
             except Exception as e:
-                self.logger.error(f"Failed to send email notification: {e}")
\ No newline at end of file
+                self.logger.error(f"Failed to send email notification: {e}")
+                self.close()
\ No newline at end of file
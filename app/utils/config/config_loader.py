@@ -1,19 +1,29 @@
 import json
+import os
 
 class ConfigLoader:
+    # Parsed configurations shared by every loader: path -> (modification time, config dict)
+    _cache = {}
+
     def __init__(self, config_path="config.json"):
         self.config_path = config_path
         self.config = self.__load_config()
 
     def __load_config(self):
-        """Private method to load the JSON configuration file."""
+        """Private method to load the JSON configuration file, reusing the parsed dict while the file is unchanged."""
         try:
+            mtime = os.stat(self.config_path).st_mtime_ns
+            cached = ConfigLoader._cache.get(self.config_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
             with open(self.config_path, "r") as file:
-                return json.load(file)
+                config = json.load(file)
         except FileNotFoundError:
             raise Exception(f"Configuration file not found at {self.config_path}.")
         except json.JSONDecodeError as e:
             raise Exception(f"Failed to parse JSON: {e}")
+        ConfigLoader._cache[self.config_path] = (mtime, config)
+        return config
 
     def get(self, key, default=None):
         """Retrieve a configuration value."""
@@ -1,135 +1,100 @@
 
+import numpy as np
+from app.utils import kernels
+
+
+def _as_closes(closing_prices):
+    """Returns the closing prices as a float64 array, without copying one that already is."""
+    return np.asarray(closing_prices, dtype=np.float64)
+
+
+def _to_list(values):
+    """Converts a kernel output array to a list, with None where the kernel left NaN."""
+    return [None if v != v else v for v in values.tolist()]
+
+
 class IndicatorCalculator:
-    """A class dedicated to calculating technical indicators using candlestick data."""
+    """
+    A class dedicated to calculating technical indicators using candlestick data.
+
+    The closing prices may be a list or a float64 NumPy array (see extract_closing_array);
+    the rolling sums and recurrences run in the compiled kernels of app.utils.kernels and
+    the results are returned as lists, with None where a value is undefined.
+    """
 
     @staticmethod
     def extract_closing_prices(candlesticks):
         """Extracts closing prices from candlestick data."""
         return [float(c["close"]) for c in candlesticks]
 
+    @staticmethod
+    def extract_closing_array(candlesticks):
+        """
+        Extracts closing prices from candlestick data as a float64 array, to share between indicators.
+
+        Candles stored by column (SoA dicts from candles_to_soa, DataFrames or structured
+        arrays) return their close column, without a copy when it is already float64.
+        """
+        dtype = getattr(candlesticks, "dtype", None)
+        if isinstance(candlesticks, dict) or hasattr(candlesticks, "columns") or (dtype is not None and dtype.names):
+            return np.ascontiguousarray(candlesticks["close"], dtype=np.float64)
+        return np.fromiter((float(c["close"]) for c in candlesticks), dtype=np.float64, count=len(candlesticks))
+
     @staticmethod
     def calculate_sma(period, closing_prices):
         """Calculate Simple Moving Average (SMA)."""
-        return [sum(closing_prices[i - period:i]) / period for i in range(period, len(closing_prices))]
+        # Averages of the windows ending at indices period-1 .. n-2 (the last window is not included)
+        return kernels.sma(_as_closes(closing_prices), period)[period - 1:-1].tolist()
 
     @staticmethod
     def calculate_ema(period, closing_prices):
         """Calculate Exponential Moving Average (EMA)."""
-        ema = [None] * (period - 1)  # None values for early indices
-        multiplier = 2 / (period + 1)
-        initial_sma = sum(closing_prices[:period]) / period
-        ema.append(initial_sma)
-
-        for i in range(period, len(closing_prices)):
-            new_ema = (closing_prices[i] - ema[-1]) * multiplier + ema[-1]
-            ema.append(new_ema)
-        return ema
+        closes = _as_closes(closing_prices)
+        if len(closes) < period:
+            # Not enough data: only the initial SMA of the available prices
+            return [None] * (period - 1) + [closes.sum() / period]
+        return _to_list(kernels.ema(closes, period))
 
     @staticmethod
     def calculate_bollinger_bands(period, std_dev_multiplier, closing_prices):
         """Calculate Bollinger Bands."""        
-        # Verificar si la longitud de los precios de cierre es menor que el período
-        if len(closing_prices) < period:
-            raise ValueError(f"La longitud de los datos ({len(closing_prices)}) es menor que el período especificado ({period}).")
-        
-        # Calcular la Media Móvil Simple (SMA)
-        sma = IndicatorCalculator.calculate_sma(period, closing_prices)
-
-        # Verificar que la SMA tenga la longitud adecuada
+        closes = _as_closes(closing_prices)
+
+        # Check that there are at least as many closing prices as the period
+        if len(closes) < period:
+            raise ValueError(f"La longitud de los datos ({len(closes)}) es menor que el período especificado ({period}).")
+
+        # Rolling mean and standard deviation of every window, in a single pass
+        means, std_devs = kernels.rolling_mean_std(closes, period)
+
+        # Simple Moving Average (SMA) of the windows ending at indices period-1 .. n-2
+        sma = means[period - 1:-1]
+
+        # Check that the SMA has the expected length
         if len(sma) < period:
             raise ValueError(f"La longitud de la SMA calculada es demasiado corta. Longitud: {len(sma)}, Período: {period}")
 
-        # Calcular las desviaciones estándar para cada valor en los precios de cierre
-        std_devs = []
-        for i in range(len(closing_prices)):
-            if i >= (period):
-                # Obtener los últimos 'period' precios de cierre
-                window = closing_prices[i - period + 1:i + 1]  
-                mean = sum(window) / period
-                variance = sum((x - mean) ** 2 for x in window) / period
-                std_dev = variance ** 0.5
-                std_devs.append(std_dev)
-
-        # Calcular las bandas superior e inferior de Bollinger
-        upper_band = []
-        lower_band = []
-        for i in range(len(sma)):
-            if sma[i] is not None and std_devs[i] is not None:  # Asegurarse de que ambos sean números válidos
-                upper_band.append(sma[i] + std_dev_multiplier * std_devs[i])
-                lower_band.append(sma[i] - std_dev_multiplier * std_devs[i])
-            else:
-                upper_band.append(None)  # No se puede calcular si no hay datos
-                lower_band.append(None)
-
-        return upper_band, lower_band
+        # Standard deviation of the windows ending at indices period .. n-1
+        std_devs = std_devs[period:]
+
+        # Upper and lower Bollinger Bands
+        upper_band = sma + std_dev_multiplier * std_devs
+        lower_band = sma - std_dev_multiplier * std_devs
+        return upper_band.tolist(), lower_band.tolist()
 
     @staticmethod
     def calculate_rsi(period, closing_prices):
-        gains = []
-        losses = []
-
-        for i in range(1, len(closing_prices)):
-            change = closing_prices[i] - closing_prices[i - 1]
-            gains.append(max(change, 0))
-            losses.append(abs(min(change, 0)))
-
-        # Calculate average gain and loss
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
-
-        rsi = [None] * period  # Padding initial values
-        
-        # Initial RS value
-        if avg_loss == 0:
-            rsi.append(100)
-        else:
-            rs = avg_gain / avg_loss
-            rsi.append(100 - (100 / (1 + rs)))
-
-        # Smoothly calculate RSI using the Wilder’s formula
-        for i in range(period + 1, len(closing_prices)):
-            avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
-            
-            if avg_loss == 0:
-                rsi.append(100)
-            else:
-                rs = avg_gain / avg_loss
-                rsi.append(100 - (100 / (1 + rs)))
-            
-        return rsi
+        """Calculate the Wilder-smoothed Relative Strength Index (RSI); the first `period` values are None."""
+        return _to_list(kernels.rsi(_as_closes(closing_prices), period))
 
     @staticmethod
     def calculate_macd(closing_prices, short_period=12, long_period=26, signal_period=9):
         """
         Calculate the MACD (Moving Average Convergence Divergence) indicator.
+
+        The MACD line, the signal line and the histogram come from a single pass over the
+        closing prices; each is a list aligned with them, with None before it is defined.
         """
-        # Fix: correct parameter order for calculate_ema (period, closing_prices)
-        short_ema = IndicatorCalculator.calculate_ema(short_period, closing_prices)
-        long_ema = IndicatorCalculator.calculate_ema(long_period, closing_prices)
-
-        # Calculate MACD line (element-wise subtraction)
-        macd_line = []
-        for i in range(len(short_ema)):
-            if short_ema[i] is not None and long_ema[i] is not None:
-                macd_line.append(short_ema[i] - long_ema[i])
-            else:
-                macd_line.append(None)
-
-        # Filter out None values for signal line calculation
-        valid_macd_values = [val for val in macd_line if val is not None]
-        signal_line_values = IndicatorCalculator.calculate_ema(signal_period, valid_macd_values)
-
-        # Pad signal line with Nones to match macd_line length
-        num_nones = len(macd_line) - len(signal_line_values)
-        signal_line = [None] * num_nones + signal_line_values
-
-        # Calculate histogram (element-wise subtraction)
-        histogram = []
-        for i in range(len(macd_line)):
-            if macd_line[i] is not None and signal_line[i] is not None:
-                histogram.append(macd_line[i] - signal_line[i])
-            else:
-                histogram.append(None)
-
-        return macd_line, signal_line, histogram
\ No newline at end of file
+        macd_line, signal_line, histogram = kernels.macd(_as_closes(closing_prices), short_period,
+                                                         long_period, signal_period)
+        return _to_list(macd_line), _to_list(signal_line), _to_list(histogram)
\ No newline at end of file
@@ -0,0 +1,303 @@
+"""
+Numerical kernels used by the charts and the indicators.
+
+The kernels are compiled with Numba when it is installed; otherwise they run
+as plain Python functions over NumPy arrays, with the same results.
+
+The indicator kernels declare explicit signatures, so Numba compiles them when this
+module is imported instead of on the first chart update, and cache=True keeps the
+machine code on disk so later starts load it instead of compiling again. They also
+release the GIL while they run (nogil=True), so a chart update computed in the thread
+pool doesn't hold up the GUI thread.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled when Numba is missing."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Kernel signatures: float64 price arrays and int64 periods
+_SERIES_SIGNATURE = "f8[:](f8[:], i8)"
+_BANDS_SIGNATURE = "UniTuple(f8[:], 2)(f8[:], i8, f8)"
+_AVERAGES_SIGNATURE = "UniTuple(f8[:], 2)(f8[:], i8)"
+_MACD_SIGNATURE = "UniTuple(f8[:], 3)(f8[:], i8, i8, i8)"
+
+
+@njit(_SERIES_SIGNATURE, cache=True, nogil=True)
+def sma(closes, period):
+    """
+    Calculate the Simple Moving Average (SMA) with a running window sum.
+
+    :param closes: Closing prices as a float64 array.
+    :param period: SMA period.
+    :return: Array aligned with closes; the first `period - 1` values are NaN.
+    """
+    n = len(closes)
+    out = np.full(n, np.nan)
+    if n < period:
+        return out
+
+    total = 0.0
+    for i in range(n):
+        total += closes[i]
+        if i >= period:
+            total -= closes[i - period]
+        if i >= period - 1:
+            out[i] = total / period
+    return out
+
+
+@njit(_SERIES_SIGNATURE, cache=True, nogil=True)
+def ema(closes, period):
+    """
+    Calculate the Exponential Moving Average (EMA), seeded with the SMA of the first window.
+
+    :param closes: Closing prices as a float64 array.
+    :param period: EMA period.
+    :return: Array aligned with closes; the first `period - 1` values are NaN.
+    """
+    n = len(closes)
+    out = np.full(n, np.nan)
+    if n < period:
+        return out
+
+    multiplier = 2 / (period + 1)
+    prev = 0.0
+    for i in range(period):
+        prev += closes[i]
+    prev /= period
+    out[period - 1] = prev
+
+    for i in range(period, n):
+        prev = (closes[i] - prev) * multiplier + prev
+        out[i] = prev
+    return out
+
+
+@njit(_AVERAGES_SIGNATURE, cache=True, nogil=True)
+def rolling_mean_std(closes, period):
+    """
+    Calculate the rolling mean and population standard deviation of each window.
+
+    The window mean and sum of squared deviations are updated with Welford's
+    sliding-window recurrence, so each step is O(1).
+
+    :param closes: Closing prices as a float64 array.
+    :param period: Window length.
+    :return: (mean, std_dev) arrays aligned with closes; the first `period - 1` values are NaN.
+    """
+    n = len(closes)
+    means = np.full(n, np.nan)
+    std_devs = np.full(n, np.nan)
+    if n < period:
+        return means, std_devs
+
+    # Plain Welford accumulation over the first window
+    mean = 0.0
+    m2 = 0.0
+    for i in range(period):
+        delta = closes[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (closes[i] - mean)
+
+    for i in range(period - 1, n):
+        if i >= period:
+            # Slide the window: replace the oldest price with the newest one
+            old = closes[i - period]
+            new = closes[i]
+            new_mean = mean + (new - old) / period
+            m2 += (new - old) * (new - new_mean + old - mean)
+            mean = new_mean
+        variance = m2 / period if m2 > 0 else 0.0
+        means[i] = mean
+        std_devs[i] = variance ** 0.5
+    return means, std_devs
+
+
+@njit(_BANDS_SIGNATURE, cache=True, nogil=True)
+def bollinger_bands(closes, period, std_dev_multiplier):
+    """
+    Calculate Bollinger Bands from the rolling mean and population standard deviation.
+
+    :param closes: Closing prices as a float64 array.
+    :param period: Window length.
+    :param std_dev_multiplier: Number of standard deviations between the mean and each band.
+    :return: (upper, lower) arrays aligned with closes; the first `period - 1` values are NaN.
+    """
+    means, std_devs = rolling_mean_std(closes, period)
+    return means + std_dev_multiplier * std_devs, means - std_dev_multiplier * std_devs
+
+
+@njit(_AVERAGES_SIGNATURE, cache=True, nogil=True)
+def wilder_averages(closes, period):
+    """
+    Calculate Wilder's smoothed average gain and average loss used by the RSI.
+
+    :param closes: Closing prices as a float64 array.
+    :param period: Smoothing period.
+    :return: (avg_gain, avg_loss) arrays aligned with closes; the first `period` values are NaN.
+    """
+    n = len(closes)
+    avg_gains = np.full(n, np.nan)
+    avg_losses = np.full(n, np.nan)
+    if n <= period:
+        return avg_gains, avg_losses
+
+    # Seed the averages with the simple mean of the first `period` changes
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = closes[i] - closes[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+    avg_gains[period] = avg_gain
+    avg_losses[period] = avg_loss
+
+    # Wilder's smoothing for the rest of the series
+    for i in range(period + 1, n):
+        change = closes[i] - closes[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        avg_gains[i] = avg_gain
+        avg_losses[i] = avg_loss
+
+    return avg_gains, avg_losses
+
+
+@njit(_SERIES_SIGNATURE, cache=True, nogil=True)
+def rsi(closes, period):
+    """
+    Calculate the Wilder-smoothed Relative Strength Index (RSI).
+
+    :param closes: Closing prices as a float64 array.
+    :param period: RSI period.
+    :return: Array aligned with closes; the first `period` values are NaN.
+    """
+    avg_gains, avg_losses = wilder_averages(closes, period)
+    out = np.full(len(closes), np.nan)
+    for i in range(period, len(closes)):
+        avg_loss = avg_losses[i]
+        out[i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gains[i] / avg_loss)
+    return out
+
+
+@njit(_MACD_SIGNATURE, cache=True, nogil=True)
+def macd(closes, short_period, long_period, signal_period):
+    """
+    Calculate the MACD line, its signal line and the histogram in a single pass.
+
+    The short and long EMAs are updated in the same loop, and the signal EMA is fed
+    with each MACD value as soon as both EMAs are defined. Every EMA is seeded with
+    the SMA of its first window, like the ema kernel.
+
+    :param closes: Closing prices as a float64 array.
+    :param short_period: Period of the fast EMA.
+    :param long_period: Period of the slow EMA.
+    :param signal_period: Period of the EMA of the MACD line.
+    :return: (macd, signal, histogram) arrays aligned with closes. The MACD line starts
+             at index long_period - 1 and the signal line signal_period - 1 values later;
+             earlier values are NaN.
+    """
+    n = len(closes)
+    macd_line = np.full(n, np.nan)
+    signal_line = np.full(n, np.nan)
+    histogram = np.full(n, np.nan)
+    if n < long_period or n < short_period:
+        return macd_line, signal_line, histogram
+
+    short_multiplier = 2 / (short_period + 1)
+    long_multiplier = 2 / (long_period + 1)
+    signal_multiplier = 2 / (signal_period + 1)
+    ema_short = 0.0
+    ema_long = 0.0
+    signal = 0.0
+    for i in range(n):
+        price = closes[i]
+        if i < short_period:
+            ema_short += price
+            if i == short_period - 1:
+                ema_short /= short_period
+        else:
+            ema_short = (price - ema_short) * short_multiplier + ema_short
+        if i < long_period:
+            ema_long += price
+            if i == long_period - 1:
+                ema_long /= long_period
+        else:
+            ema_long = (price - ema_long) * long_multiplier + ema_long
+        if i < long_period - 1:
+            continue
+
+        value = ema_short - ema_long
+        macd_line[i] = value
+        j = i - (long_period - 1)  # Position among the defined MACD values
+        if j < signal_period:
+            signal += value
+            if j < signal_period - 1:
+                continue
+            signal /= signal_period
+        else:
+            signal = (value - signal) * signal_multiplier + signal
+        signal_line[i] = signal
+        histogram[i] = value - signal
+
+    return macd_line, signal_line, histogram
+
+
+@njit(parallel=True, cache=True)
+def parallel_cumsum(x, block_size=4096):
+    """
+    Cumulative sum computed as a two-phase block scan, spread over all cores.
+
+    Each block is scanned independently, the block totals are scanned serially and
+    then added back as offsets. It does twice the work of np.cumsum, so it only pays
+    off on very long inputs such as deep order books.
+
+    :param x: Values as a float64 array.
+    :param block_size: Number of elements scanned by each task.
+    :return: Array with the running totals of x.
+    """
+    n = len(x)
+    out = np.empty(n)
+    n_blocks = (n + block_size - 1) // block_size
+    block_sums = np.zeros(n_blocks)
+
+    # Phase 1: scan every block on its own
+    for b in prange(n_blocks):
+        start = b * block_size
+        end = min(start + block_size, n)
+        total = 0.0
+        for i in range(start, end):
+            total += x[i]
+            out[i] = total
+        block_sums[b] = total
+
+    # Scan the block totals; there are few of them, so this stays serial
+    for b in range(1, n_blocks):
+        block_sums[b] += block_sums[b - 1]
+
+    # Phase 2: shift each block by the total of the blocks before it
+    for b in prange(1, n_blocks):
+        start = b * block_size
+        end = min(start + block_size, n)
+        offset = block_sums[b - 1]
+        for i in range(start, end):
+            out[i] += offset
+
+    return out
@@ -1,18 +1,57 @@
+import functools
 import logging
 import sys
 import os
+import threading
+import time
 
 # Global variables to control the verbosity level and where to log
 verbose_level = 1       # Global variable to control the verbosity level (0: DEBUG, 1: INFO, 2: WARNING, 3: ERROR)
 log_to_terminal = True  # Whether to log to terminal (stdout)
 log_to_file = False      # Whether to log to a file (app.log)
 log_file_path = "logs/app.log"  # Specify the desired log file location
+log_rate_limit = 1.0    # Minimum seconds between two INFO (or lower) periodic refresh records with the same message (0: no limit)
 
-# Create the logs directory if it doesn't exist
-if log_to_file and not os.path.exists(os.path.dirname(log_file_path)):
-    os.makedirs(os.path.dirname(log_file_path))
+class RateLimitingFilter(logging.Filter):
+    """
+    Lets through at most one record per message template every `interval` seconds.
 
-# Set up logging
+    Only records at INFO level or below are limited; warnings and errors always pass.
+    setup_logger attaches it to the "refresh" child logger only, which the main window
+    uses for the messages it logs on every periodic refresh, so user and order actions
+    logged on the app logger are never dropped. Records are keyed by logger name and unformatted message, so the periodic update
+    messages are throttled no matter which pair or interval they mention. Messages
+    formatted before logging (f-strings) make a new key each time, so keys older than
+    `interval` are swept out once per interval and the table stays small.
+    """
+
+    def __init__(self, interval=1.0):
+        super().__init__()
+        self.interval = interval
+        self._last_emitted = {}  # (logger name, message template) -> monotonic time
+        self._last_sweep = time.monotonic()
+        # Records arrive from the GUI thread, the data worker and the thread pools at once
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > logging.INFO:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep >= self.interval:
+                # Expired keys no longer throttle anything
+                self._last_emitted = {k: t for k, t in self._last_emitted.items() if now - t < self.interval}
+                self._last_sweep = now
+            last = self._last_emitted.get(key)
+            if last is not None and now - last < self.interval:
+                return False
+            self._last_emitted[key] = now
+            return True
+
+
+# Set up logging (once per process: every caller shares the same logger and handlers)
+@functools.lru_cache(maxsize=None)
 def setup_logger():
     # Log levels mapping
     log_levels = {
@@ -28,16 +67,28 @@ def setup_logger():
     logger = logging.getLogger(__name__)
     logger.setLevel(level)
 
+    # Handlers are already attached if the logger was configured before
+    if logger.handlers:
+        return logger
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    # Throttle the messages repeated on every periodic refresh; they are logged on the
+    # "refresh" child logger, which propagates to the handlers below
+    if log_rate_limit > 0:
+        logger.getChild("refresh").addFilter(RateLimitingFilter(log_rate_limit))
+
     # Add terminal logging handler
     if log_to_terminal:
         terminal_handler = logging.StreamHandler(sys.stdout)
         terminal_handler.setLevel(level)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         terminal_handler.setFormatter(formatter)
         logger.addHandler(terminal_handler)
 
     # Add file logging handler
     if log_to_file:
+        # Create the logs directory if it doesn't exist
+        os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
         file_handler = logging.FileHandler(log_file_path)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Order:
+    """
+    Open order as shown by the UI, independent of the API it came from.
+
+    Declared with __slots__ (instead of dataclass(slots=True), which needs Python 3.10)
+    so each order carries no per-instance __dict__.
+    """
+    __slots__ = ("side", "price", "orig_qty")
+
+    side: str
+    price: str
+    orig_qty: str
+
+    @classmethod
+    def from_dict(cls, order):
+        """
+        Builds an Order from an API order dictionary.
+
+        :param order: Binance order (price, origQty) or Alpaca order (limit_price, qty).
+        """
+        price = order.get("price", order.get("limit_price"))
+        orig_qty = order.get("origQty", order.get("qty"))
+        return cls(side=str(order["side"]), price=str(price), orig_qty=str(orig_qty))
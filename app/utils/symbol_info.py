@@ -1,6 +1,9 @@
 
 
 class SymbolInfo:
+    # Instances are built for every listed symbol, so they carry no per-instance __dict__
+    __slots__ = ("name", "exchange", "symbol")
+
     def __init__(self, name: str, exchange: str, symbol: str):
         """
         Initializes the SymbolInfo class.
@@ -1,9 +1,15 @@
 import sys
-from PyQt5.QtWidgets import QApplication
-from app.ui.windows import MainWindow  
-from app.utils.logger import setup_logger
 
 def create_main_window():
+    # Qt and the application modules are imported here, so importing main stays cheap
+    from PyQt5.QtCore import Qt, QCoreApplication
+    from PyQt5.QtWidgets import QApplication
+    from app.ui.windows import MainWindow
+    from app.utils.logger import setup_logger
+
+    # The charts render through OpenGL viewports; let them share one GL context.
+    # Must be set before the QApplication is created.
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     # Set taskbar icon for Windows specifically
     if sys.platform == 'win32':